@@ -3,13 +3,40 @@
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-
-from .const import CONFIGFLOW_VERSION, LOGGER
-from .coordinator import OmnikInverterDataUpdateCoordinator
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+
+from .const import CONF_BACKGROUND_STARTUP, CONFIGFLOW_VERSION, DOMAIN, LOGGER
+from .coordinator import (
+    OmnikInverterDataUpdateCoordinator,
+    async_get_snapshot_store,
+)
+from .export import OmnikInverterExportView
+from .metrics import OmnikInverterMetricsView
+from .services import async_setup_services
 
 type OmnikInverterConfigEntry = ConfigEntry[OmnikInverterDataUpdateCoordinator]
 
-PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR]
+PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.EVENT]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)  # pylint: disable=invalid-name
+
+
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up the Omnik Inverter integration.
+
+    Args:
+        hass: The HomeAssistant instance.
+        _config: The configuration.yaml of Home Assistant.
+
+    Returns:
+        Return true after setting up.
+
+    """
+    hass.http.register_view(OmnikInverterExportView())
+    hass.http.register_view(OmnikInverterMetricsView())
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(
@@ -26,14 +53,40 @@ async def async_setup_entry(
 
     """
     coordinator = OmnikInverterDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    restored = await coordinator.async_restore_snapshot()
+    background = restored or entry.options.get(CONF_BACKGROUND_STARTUP, False)
+    if not background:
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    if background:
+        # Entities start with the last known values, or unavailable,
+        # refresh without holding up the startup of Home Assistant.
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_background_first_refresh(),
+            f"{DOMAIN} {entry.title} first refresh",
+        )
 
     return True
 
 
+async def async_update_options(
+    _hass: HomeAssistant, entry: OmnikInverterConfigEntry
+) -> None:
+    """Apply changed options without reloading the config entry.
+
+    Args:
+        _hass: The HomeAssistant instance.
+        entry: The ConfigEntry containing the user input.
+
+    """
+    entry.runtime_data.async_apply_options()
+
+
 async def async_unload_entry(
     hass: HomeAssistant, entry: OmnikInverterConfigEntry
 ) -> bool:
@@ -50,6 +103,19 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: OmnikInverterConfigEntry
+) -> None:
+    """Remove the stored snapshot when a config entry is removed.
+
+    Args:
+        hass: The HomeAssistant instance.
+        entry: The ConfigEntry containing the user input.
+
+    """
+    await async_get_snapshot_store(hass, entry.entry_id).async_remove()
+
+
 async def async_migrate_entry(
     _hass: HomeAssistant,
     config_entry: ConfigEntry,
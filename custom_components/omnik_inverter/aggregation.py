@@ -0,0 +1,276 @@
+"""Aggregation of high-rate samples for the Omnik Inverter integration."""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta
+
+    from omnikinverter import Inverter
+
+# Inverter fields that are published as the mean over the publish window.
+AGGREGATED_KEYS = ("solar_current_power", "ac_output_power")
+
+
+@dataclass(slots=True)
+class WindowStatistics:
+    """Running statistics of the samples within a single publish window."""
+
+    count: int = 0
+    total: float = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+
+    def add(self, value: float) -> None:
+        """Add a sample to the window.
+
+        Args:
+            value: The sampled value.
+
+        """
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the samples in the window.
+
+        Returns:
+            The mean value, or None if no samples were added.
+
+        """
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as state attributes.
+
+        The mean is published as the state itself.
+
+        Returns:
+            A dict with the minimum, maximum and sample count.
+
+        """
+        return {
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "samples": self.count,
+        }
+
+
+class SampleAggregator:
+    """Collect inverter samples and publish them per window."""
+
+    def __init__(self) -> None:
+        """Initialise an empty aggregator."""
+        self._window: dict[str, list[WindowStatistics]] = {}
+        self.published: dict[str, list[WindowStatistics]] = {}
+
+    def add(self, inverter: Inverter) -> None:
+        """Add the aggregated fields of an inverter sample to the window.
+
+        Args:
+            inverter: The sampled inverter data.
+
+        """
+        for key in AGGREGATED_KEYS:
+            value = getattr(inverter, key)
+            if value is None:
+                continue
+            values = value if isinstance(value, list) else [value]
+            statistics = self._window.setdefault(key, [])
+            statistics.extend(
+                WindowStatistics() for _ in range(len(values) - len(statistics))
+            )
+            for statistic, sample in zip(statistics, values, strict=False):
+                if sample is not None:
+                    statistic.add(sample)
+
+    def publish(self, inverter: Inverter) -> Inverter:
+        """Close the current window and apply its means to the inverter data.
+
+        Args:
+            inverter: The most recent inverter data.
+
+        Returns:
+            A copy of the inverter data with the aggregated fields replaced
+            by their mean over the window.
+
+        """
+        self.published, self._window = self._window, {}
+
+        changes: dict[str, Any] = {}
+        for key, statistics in self.published.items():
+            value = getattr(inverter, key)
+            if value is None:
+                continue
+            means = [statistic.mean for statistic in statistics]
+            if isinstance(value, list):
+                changes[key] = [
+                    current if mean is None else mean
+                    for mean, current in zip(means, value, strict=False)
+                ]
+            elif means[0] is not None:
+                changes[key] = round(means[0])
+
+        return dataclasses.replace(inverter, **changes)
+
+    def statistics(self, key: str, index: int = 0) -> WindowStatistics | None:
+        """Return the statistics of the last published window for a field.
+
+        Args:
+            key: The inverter field.
+            index: The index for list fields.
+
+        Returns:
+            The statistics, or None if the field was not sampled.
+
+        """
+        statistics = self.published.get(key)
+        if statistics is None or index >= len(statistics):
+            return None
+        return statistics[index]
+
+
+class EnergyIntegrator:
+    """Integrate power samples into a high resolution energy counter for today.
+
+    Power samples are integrated with the trapezoidal rule. Samples that are
+    further apart than `max_gap` (e.g. while the logger was unreachable) are
+    not integrated. The counter resets at local midnight and is kept within
+    `resolution` of the coarse counters reported by the logger, so it never
+    drifts away from them.
+
+    Loggers may keep reporting the energy of yesterday for a while after
+    midnight. Until the logger counter resets, references above the
+    integrated energy are ignored. When the logger counter drops, the day is
+    re-anchored there. Otherwise the counter never decreases within a day.
+    """
+
+    def __init__(self, max_gap: timedelta, resolution: float) -> None:
+        """Initialise the integrator.
+
+        Args:
+            max_gap: The longest interval between samples that is integrated.
+            resolution: The resolution of the logger counters in kWh.
+
+        """
+        self.max_gap = max_gap
+        self.resolution = resolution
+        self.energy_today = 0.0
+        self._day: date | None = None
+        self._last_sample: tuple[datetime, float] | None = None
+        self._total_at_start_of_day: float | None = None
+        self._upper_bound = math.inf
+        self._reference: float | None = None
+        self._awaiting_reset = False
+
+    def add(self, timestamp: datetime, power: float | None) -> None:
+        """Integrate a power sample.
+
+        Args:
+            timestamp: The time of the sample.
+            power: The sampled power in W, or None if unknown.
+
+        """
+        day = dt_util.as_local(timestamp).date()
+        if day != self._day:
+            self._awaiting_reset = self._day is not None
+            self._day = day
+            self.energy_today = 0.0
+            self._last_sample = None
+            self._total_at_start_of_day = None
+            self._upper_bound = math.inf
+
+        if power is None:
+            self._last_sample = None
+            return
+
+        if self._last_sample is not None:
+            last_timestamp, last_power = self._last_sample
+            elapsed = timestamp - last_timestamp
+            if elapsed.total_seconds() > 0 and elapsed <= self.max_gap:
+                energy = (last_power + power) / 2 * elapsed.total_seconds() / 3_600_000
+                self._increase(self.energy_today + energy)
+        self._last_sample = (timestamp, power)
+
+    def reconcile(self, energy_today: float | None, energy_total: float | None) -> None:
+        """Keep the counter within the resolution of the logger counters.
+
+        Args:
+            energy_today: The energy produced today reported by the logger.
+            energy_total: The total energy produced reported by the logger,
+                used when the logger does not report today's energy.
+
+        """
+        reference = energy_today
+        if reference is None and energy_total is not None:
+            if self._total_at_start_of_day is None:
+                self._total_at_start_of_day = energy_total
+            reference = energy_total - self._total_at_start_of_day
+        if reference is None:
+            return
+
+        if self._reference is not None and reference < self._reference:
+            # The logger reset its counter, re-anchor the day there.
+            self._awaiting_reset = False
+            self.energy_today = reference
+        elif self._awaiting_reset:
+            if reference > self.energy_today + self.resolution:
+                # Still the energy of yesterday.
+                self._reference = reference
+                return
+            self._awaiting_reset = False
+
+        self._reference = reference
+        self._upper_bound = reference + self.resolution
+        self._increase(reference)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the integrator for storage.
+
+        Returns:
+            A JSON serializable dict with the counter of today.
+
+        """
+        return {
+            "day": self._day.isoformat() if self._day else None,
+            "energy_today": self.energy_today,
+            "total_at_start_of_day": self._total_at_start_of_day,
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore the counter of today from storage.
+
+        The stored counter is ignored when it belongs to another day.
+
+        Args:
+            data: The stored state, as returned by `as_dict`.
+
+        """
+        if data.get("day") != dt_util.now().date().isoformat():
+            return
+        self._day = date.fromisoformat(data["day"])
+        self.energy_today = data["energy_today"]
+        self._total_at_start_of_day = data["total_at_start_of_day"]
+
+    def _increase(self, energy: float) -> None:
+        """Raise the counter, capped at the upper bound of the logger counter.
+
+        Args:
+            energy: The new energy value in kWh.
+
+        """
+        self.energy_today = max(self.energy_today, min(energy, self._upper_bound))
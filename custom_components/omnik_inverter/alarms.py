@@ -0,0 +1,125 @@
+"""Decoding of the alarm codes reported by the Omnik Inverter."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+SEVERITY_WARNING = "warning"
+SEVERITY_ERROR = "error"
+SEVERITY_CRITICAL = "critical"
+SEVERITY_UNKNOWN = "unknown"
+
+EVENT_ALARM_RAISED = "alarm_raised"
+EVENT_ALARM_CLEARED = "alarm_cleared"
+
+# Values the loggers report while there is no alarm.
+NO_ALARM_CODES = frozenset({"", "0", "00", "none", "normal"})
+
+# The fault messages of the Omniksol inverters, keyed by their normalized
+# code. Grid conditions resolve by themselves, installation faults need a
+# check of the PV installation and internal faults need service.
+ALARM_CODES: dict[str, tuple[str, str]] = {
+    "noutility": (SEVERITY_WARNING, "No utility grid connected"),
+    "gridfault": (SEVERITY_WARNING, "Grid voltage or frequency out of range"),
+    "vacfault": (SEVERITY_WARNING, "Grid voltage out of range"),
+    "facfault": (SEVERITY_WARNING, "Grid frequency out of range"),
+    "pvovervoltage": (SEVERITY_ERROR, "PV input voltage too high"),
+    "isolationfault": (SEVERITY_ERROR, "PV isolation resistance too low"),
+    "groundifault": (SEVERITY_ERROR, "Ground current too high"),
+    "overtemperature": (SEVERITY_ERROR, "Inverter temperature too high"),
+    "consistentfault": (SEVERITY_CRITICAL, "Inconsistent internal readings"),
+    "relaycheckfail": (SEVERITY_CRITICAL, "Output relay check failed"),
+    "dcinjhigh": (SEVERITY_CRITICAL, "DC injection into the grid too high"),
+    "eepromrwfail": (SEVERITY_CRITICAL, "EEPROM read or write failed"),
+    "scifailure": (SEVERITY_CRITICAL, "Internal communication failed"),
+    "highdcbus": (SEVERITY_CRITICAL, "DC bus voltage too high"),
+    "gfcifailure": (SEVERITY_CRITICAL, "Ground fault detection failed"),
+    "achctfault": (SEVERITY_CRITICAL, "AC output current sensor fault"),
+    "ref25vfault": (SEVERITY_CRITICAL, "Internal reference voltage fault"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Alarm:
+    """An alarm reported by the inverter."""
+
+    code: str
+    severity: str
+    description: str
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the alarm as state attributes.
+
+        Returns:
+            A dict with the code, severity and description.
+
+        """
+        return {
+            "code": self.code,
+            "severity": self.severity,
+            "description": self.description,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class AlarmTransition:
+    """A change of the alarm between two consecutive refreshes."""
+
+    previous: Alarm | None
+    current: Alarm | None
+
+    @property
+    def event_type(self) -> str:
+        """Return the event type of the transition.
+
+        Returns:
+            `alarm_cleared` if the alarm went away, `alarm_raised` otherwise.
+
+        """
+        return EVENT_ALARM_RAISED if self.current else EVENT_ALARM_CLEARED
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the transition as event data.
+
+        Returns:
+            The current alarm, or the cleared alarm, and the previous code.
+
+        """
+        alarm = self.current or self.previous
+        data = alarm.as_dict() if alarm else {}
+        data["previous_code"] = self.previous.code if self.previous else None
+        return data
+
+
+def _normalize(code: str) -> str:
+    """Normalize an alarm code for the lookup table.
+
+    Args:
+        code: The code as reported by the logger.
+
+    Returns:
+        The lowercased code without separators like spaces, dashes and slashes.
+
+    """
+    return "".join(character for character in code.lower() if character not in " -._/")
+
+
+def decode_alarm(code: str | None) -> Alarm | None:
+    """Decode the alarm code reported by the inverter.
+
+    Args:
+        code: The alarm code as reported by the logger.
+
+    Returns:
+        The decoded alarm, or None if there is no alarm. Codes that are not
+        in the lookup table are returned with an unknown severity.
+
+    """
+    if code is None:
+        return None
+    code = code.strip()
+    if code.lower() in NO_ALARM_CODES:
+        return None
+    severity, description = ALARM_CODES.get(_normalize(code), (SEVERITY_UNKNOWN, code))
+    return Alarm(code=code, severity=severity, description=description)
@@ -0,0 +1,174 @@
+"""Online detection of underperforming DC strings."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from omnikinverter import Inverter
+
+# Weight of a new sample in the exponentially weighted baseline.
+BASELINE_ALPHA = 0.05
+# Samples a string needs before it can be flagged.
+BASELINE_MIN_SAMPLES = 30
+# Strings are only compared when at least this many are tracked.
+MIN_STRINGS = 2
+# Strings with a smaller baseline ratio are considered not connected.
+MIN_RATIO = 0.05
+# Samples with less DC power in total are ignored, e.g. at dusk.
+MIN_TOTAL_POWER = 100.0
+# A string is flagged when its ratio drops this many standard deviations,
+# and at least `MIN_DROP` of its baseline, below the baseline.
+Z_THRESHOLD = 4.0
+MIN_DROP = 0.2
+
+EVENT_ANOMALY_DETECTED = "anomaly_detected"
+EVENT_ANOMALY_CLEARED = "anomaly_cleared"
+
+
+@dataclass(slots=True)
+class StringBaseline:
+    """Exponentially weighted mean and variance of the ratio of a string."""
+
+    mean: float = 0.0
+    variance: float = 0.0
+    samples: int = 0
+    ratio: float | None = None
+    flagged: bool = False
+
+    def update(self, value: float) -> None:
+        """Add a sample to the baseline.
+
+        Args:
+            value: The power of the string relative to its peers.
+
+        """
+        self.samples += 1
+        if self.samples == 1:
+            self.mean = value
+            return
+        difference = value - self.mean
+        increment = BASELINE_ALPHA * difference
+        self.mean += increment
+        self.variance = (1 - BASELINE_ALPHA) * (self.variance + difference * increment)
+
+    def lower_bound(self, factor: float) -> float:
+        """Return the ratio below which the string underperforms.
+
+        Args:
+            factor: The fraction of the thresholds to apply.
+
+        Returns:
+            The lower bound of the expected ratio.
+
+        """
+        margin = max(Z_THRESHOLD * math.sqrt(self.variance), MIN_DROP * self.mean)
+        return self.mean - factor * margin
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the string as state attributes.
+
+        Returns:
+            The current ratio, the baseline and whether it is flagged.
+
+        """
+        return {
+            "ratio": None if self.ratio is None else round(self.ratio, 3),
+            "baseline": round(self.mean, 3),
+            "underperforming": self.flagged,
+        }
+
+
+class StringMonitor:
+    """Compare the DC strings against each other and their own baseline.
+
+    Every poll, the power of each string is divided by the mean power of
+    the other strings, so changes in irradiance affect all strings alike.
+    Each ratio is tracked with an exponentially weighted mean and variance,
+    so strings of different sizes each get their own baseline. A string is
+    flagged when its ratio drops well below its baseline, and cleared once
+    it recovers to within half of that threshold. The baseline is frozen
+    while flagged.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the monitor without any strings."""
+        self.strings: list[StringBaseline] = []
+
+    @property
+    def tracked(self) -> list[tuple[int, StringBaseline]]:
+        """Return the strings that are connected and have a baseline.
+
+        Returns:
+            The 0-based index and baseline of every tracked string.
+
+        """
+        return [
+            (index, baseline)
+            for index, baseline in enumerate(self.strings)
+            if baseline.samples >= BASELINE_MIN_SAMPLES and baseline.mean >= MIN_RATIO
+        ]
+
+    @property
+    def underperforming(self) -> int | None:
+        """Return the number of flagged strings.
+
+        Returns:
+            The number of flagged strings, or None if fewer than two
+            strings are tracked.
+
+        """
+        tracked = self.tracked
+        if len(tracked) < MIN_STRINGS:
+            return None
+        return sum(baseline.flagged for _, baseline in tracked)
+
+    def update(self, inverter: Inverter) -> list[tuple[int, StringBaseline]]:
+        """Add the DC input of a refresh.
+
+        Args:
+            inverter: The refreshed inverter data.
+
+        Returns:
+            The 0-based index and baseline of every string that was
+            flagged or cleared by this refresh.
+
+        """
+        voltages = inverter.dc_input_voltage or []
+        currents = inverter.dc_input_current or []
+        powers = [
+            voltage * current if voltage is not None and current is not None else None
+            for voltage, current in zip(voltages, currents, strict=False)
+        ]
+        measured = [power for power in powers if power is not None]
+        total = sum(measured)
+        if total < MIN_TOTAL_POWER or len(measured) < MIN_STRINGS:
+            return []
+
+        self.strings.extend(
+            StringBaseline() for _ in range(len(powers) - len(self.strings))
+        )
+        eligible = {index for index, _ in self.tracked}
+        changed = []
+        for index, power in enumerate(powers):
+            baseline = self.strings[index]
+            peers = (total - power) / (len(measured) - 1) if power is not None else 0
+            if power is None or peers <= 0:
+                baseline.ratio = None
+                continue
+            baseline.ratio = ratio = power / peers
+
+            flagged = baseline.flagged
+            if index in eligible and len(eligible) >= MIN_STRINGS:
+                if baseline.flagged:
+                    flagged = ratio < baseline.lower_bound(0.5)
+                else:
+                    flagged = ratio < baseline.lower_bound(1.0)
+            if flagged != baseline.flagged:
+                baseline.flagged = flagged
+                changed.append((index, baseline))
+            if not baseline.flagged:
+                baseline.update(ratio)
+        return changed
@@ -2,18 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
-    BinarySensorEntityDescription,
 )
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.util import slugify
 
-from .const import SERVICE_DEVICE
-from .models import OmnikInverterEntity
+from .const import SERVICE_DEVICE, SERVICE_INVERTER
+from .models import OmnikInverterBinarySensorEntityDescription, OmnikInverterEntity
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -22,14 +21,32 @@ if TYPE_CHECKING:
     from . import OmnikInverterConfigEntry
     from .coordinator import OmnikInverterDataUpdateCoordinator
 
-BINARY_SENSORS: tuple[BinarySensorEntityDescription, ...] = (
-    BinarySensorEntityDescription(
-        key="online",
-        name="Online",
-        device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        entity_category=EntityCategory.DIAGNOSTIC,
+BINARY_SENSORS: dict[
+    Literal["inverter", "device"],
+    tuple[OmnikInverterBinarySensorEntityDescription, ...],
+] = {
+    SERVICE_DEVICE: (
+        OmnikInverterBinarySensorEntityDescription(  # pylint: disable=unexpected-keyword-arg
+            key="online",
+            name="Online",
+            device_class=BinarySensorDeviceClass.CONNECTIVITY,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
     ),
-)
+    SERVICE_INVERTER: (
+        OmnikInverterBinarySensorEntityDescription(  # pylint: disable=unexpected-keyword-arg
+            key="fault",
+            name="Fault",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+            is_on_fn=lambda coordinator: coordinator.monitoring.alarm is not None,
+            attributes_fn=lambda coordinator: (
+                coordinator.monitoring.alarm.as_dict()
+                if coordinator.monitoring.alarm
+                else None
+            ),
+        ),
+    ),
+}
 
 
 async def async_setup_entry(
@@ -52,23 +69,23 @@ async def async_setup_entry(
             coordinator,
             name=entry.title,
             description=description,
-            service=SERVICE_DEVICE,
+            service=service,
         )
-        for description in BINARY_SENSORS
+        for service, descriptions in BINARY_SENSORS.items()
+        for description in descriptions
     )
 
 
 class OmnikInverterBinarySensor(OmnikInverterEntity, BinarySensorEntity):
     """Defines an Omnik Inverter Binary Sensor."""
 
-    entity_description: BinarySensorEntityDescription
-    _options: dict[str, Any]
+    entity_description: OmnikInverterBinarySensorEntityDescription
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
         coordinator: OmnikInverterDataUpdateCoordinator,
         name: str,
-        description: BinarySensorEntityDescription,
+        description: OmnikInverterBinarySensorEntityDescription,
         service: str,
     ) -> None:
         """Initialise the entity.
@@ -90,11 +107,23 @@ class OmnikInverterBinarySensor(OmnikInverterEntity, BinarySensorEntity):
         self._attr_name = self.entity_description.name
 
     @property
-    def is_on(self) -> bool:
+    def is_on(self) -> bool | None:
         """Return True if the service is on.
 
         Returns:
             True if the device is on.
 
         """
-        return self.coordinator.last_update_success
+        return self.entity_description.is_on_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes of the binary sensor.
+
+        Returns:
+            The attributes, or None if the binary sensor has none.
+
+        """
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self.coordinator)
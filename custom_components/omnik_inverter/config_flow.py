@@ -29,11 +29,16 @@ from homeassistant.helpers.selector import (
 from omnikinverter import OmnikInverter, OmnikInverterError
 
 from .const import (
+    CONF_BACKGROUND_STARTUP,
+    CONF_DEVICE_SCAN_INTERVAL,
+    CONF_SAMPLE_INTERVAL,
     CONF_SCAN_INTERVAL,
     CONF_SERIAL,
     CONF_SOURCE_TYPE,
     CONF_USE_CACHE,
     CONFIGFLOW_VERSION,
+    DEFAULT_DEVICE_SCAN_INTERVAL,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     LOGGER,
@@ -319,7 +324,13 @@ class OmnikInverterOptionsFlowHandler(OptionsFlow):
                 )
 
                 options = {}
-                for key in (CONF_SCAN_INTERVAL, CONF_USE_CACHE):
+                for key in (
+                    CONF_SCAN_INTERVAL,
+                    CONF_DEVICE_SCAN_INTERVAL,
+                    CONF_SAMPLE_INTERVAL,
+                    CONF_USE_CACHE,
+                    CONF_BACKGROUND_STARTUP,
+                ):
                     options[key] = user_input[key]
                 return self.async_create_entry(title="", data=options)
 
@@ -360,7 +371,29 @@ class OmnikInverterOptionsFlowHandler(OptionsFlow):
                 ),
             )
         ] = vol.All(vol.Coerce(int), vol.Range(min=1))
+        fields[
+            vol.Optional(
+                CONF_DEVICE_SCAN_INTERVAL,
+                default=self.config_entry.options.get(
+                    CONF_DEVICE_SCAN_INTERVAL, DEFAULT_DEVICE_SCAN_INTERVAL
+                ),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=1))
+        fields[
+            vol.Optional(
+                CONF_SAMPLE_INTERVAL,
+                default=self.config_entry.options.get(
+                    CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL
+                ),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=0))
         fields[vol.Optional(CONF_USE_CACHE, default=False)] = bool
+        fields[
+            vol.Optional(
+                CONF_BACKGROUND_STARTUP,
+                default=self.config_entry.options.get(CONF_BACKGROUND_STARTUP, False),
+            )
+        ] = bool
 
         return self.async_show_form(
             step_id="init",
@@ -10,11 +10,54 @@ MANUFACTURER: Final = "Omnik"
 CONFIGFLOW_VERSION = 2
 LOGGER = logging.getLogger(__package__)
 DEFAULT_SCAN_INTERVAL = 4
+DEFAULT_DEVICE_SCAN_INTERVAL = 30
+DEFAULT_SAMPLE_INTERVAL = 0
+
+# Resolution of the energy counters reported by most loggers, in kWh.
+ENERGY_RESOLUTION = 0.1
+# Power samples further apart than this many poll intervals are not integrated.
+ENERGY_MAX_GAP_FACTOR = 3
+
+# Refresh requests (e.g. `homeassistant.update_entity`) arriving within this
+# many seconds of each other are coalesced into a single fetch.
+REQUEST_REFRESH_COOLDOWN = 5
+
+# Seconds a refresh may take per source type, shared by all its requests.
+REFRESH_DEADLINES = {"html": 15, "javascript": 15, "json": 20, "tcp": 10}
+
+DATA_CLIENTS = "clients"
+DATA_HOST_LOCKS = "host_locks"
+DATA_REFRESH_TIMES = "refresh_times"
+DATA_REQUESTS = "requests"
+
+# Minimum seconds between refreshes of a host requested with the service.
+REFRESH_MIN_SPACING = 30
+
+# Maximum random deviation in seconds from the scheduled refresh slot.
+SCHEDULE_JITTER = 5
+
+# Seconds between the first refreshes of entries started in the background.
+STARTUP_STAGGER = 2
+
+# Number of raw inverter snapshots kept per entry for the export endpoint.
+HISTORY_SIZE = 360
+
+STORAGE_VERSION = 1
+# Delay in seconds before the last snapshot is written to disk.
+SNAPSHOT_SAVE_DELAY = 60
+
+# Fired on the bus when the alarm of an inverter is raised or cleared.
+EVENT_ALARM: Final = f"{DOMAIN}_alarm"
+# Fired on the bus when a DC string starts or stops underperforming.
+EVENT_STRING_ANOMALY: Final = f"{DOMAIN}_string_anomaly"
 
 CONF_SOURCE_TYPE = "source_type"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_DEVICE_SCAN_INTERVAL = "device_scan_interval"
+CONF_SAMPLE_INTERVAL = "sample_interval"
 CONF_SERIAL = "serial"
 CONF_USE_CACHE = "use_cache"
+CONF_BACKGROUND_STARTUP = "background_startup"
 
 ATTR_ENTRY_TYPE: Final = "entry_type"
 ENTRY_TYPE_SERVICE: Final = "service"
@@ -1,30 +1,80 @@
 """Omnik Inverter platform configuration."""
 
+import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
-from datetime import timedelta
-from typing import TypedDict
+import random
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Any, TypedDict
+from weakref import WeakValueDictionary
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from omnikinverter import Device, Inverter, OmnikInverter
-from omnikinverter.exceptions import OmnikInverterAuthError, OmnikInverterError
+from omnikinverter.exceptions import (
+    OmnikInverterAuthError,
+    OmnikInverterConnectionError,
+    OmnikInverterError,
+)
 
+from .aggregation import EnergyIntegrator, SampleAggregator
+from .alarms import Alarm, AlarmTransition, decode_alarm
+from .anomaly import EVENT_ANOMALY_CLEARED, EVENT_ANOMALY_DETECTED, StringMonitor
 from .const import (
+    CONF_DEVICE_SCAN_INTERVAL,
+    CONF_SAMPLE_INTERVAL,
     CONF_SCAN_INTERVAL,
     CONF_SERIAL,
     CONF_SOURCE_TYPE,
+    DATA_CLIENTS,
+    DATA_HOST_LOCKS,
+    DATA_REQUESTS,
+    DEFAULT_DEVICE_SCAN_INTERVAL,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    ENERGY_MAX_GAP_FACTOR,
+    ENERGY_RESOLUTION,
+    EVENT_ALARM,
+    EVENT_STRING_ANOMALY,
+    HISTORY_SIZE,
+    REFRESH_DEADLINES,
+    REQUEST_REFRESH_COOLDOWN,
+    SCHEDULE_JITTER,
     SERVICE_DEVICE,
     SERVICE_INVERTER,
+    SNAPSHOT_SAVE_DELAY,
+    STARTUP_STAGGER,
+    STORAGE_VERSION,
+)
+from .metrics import EntryMetrics
+from .profiling import (
+    PHASE_FAN_OUT,
+    PHASE_PROCESS,
+    PHASE_REQUEST,
+    RefreshProfiler,
 )
+from .status_page import async_request_status_page
+from .tcp import async_request_inverter
 
 _LOGGER = logging.getLogger(__name__)
 
+type RequestResult = tuple[Inverter, Device | None]
+
 
 class OmnikInverterData(TypedDict):
     """Class for defining data in dict."""
@@ -33,6 +83,97 @@ class OmnikInverterData(TypedDict):
     device: Device
 
 
+@dataclasses.dataclass(slots=True)
+class EntryMonitoring:
+    """The history, metrics, alarm, strings and profiler of a config entry."""
+
+    history: deque[tuple[datetime, Inverter]] = dataclasses.field(
+        default_factory=lambda: deque(maxlen=HISTORY_SIZE)
+    )
+    metrics: EntryMetrics = dataclasses.field(default_factory=EntryMetrics)
+    profiler: RefreshProfiler = dataclasses.field(default_factory=RefreshProfiler)
+    alarm: Alarm | None = None
+    alarm_transition: AlarmTransition | None = None
+    strings: StringMonitor = dataclasses.field(default_factory=StringMonitor)
+
+
+def async_get_host_lock(hass: HomeAssistant, host: str) -> asyncio.Lock:
+    """Return the lock guarding all requests to a single logger.
+
+    Args:
+        hass: The HomeAssistant instance.
+        host: The host name or IP address of the logger.
+
+    Returns:
+        The lock shared by every config entry pointing at this host.
+
+    """
+    locks: dict[str, asyncio.Lock] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_HOST_LOCKS, {}
+    )
+    return locks.setdefault(host.strip().lower(), asyncio.Lock())
+
+
+def async_get_requests(
+    hass: HomeAssistant,
+) -> dict[tuple[Any, ...], tuple[asyncio.Task[RequestResult], bool]]:
+    """Return the requests in flight, keyed by the user input of the client.
+
+    Args:
+        hass: The HomeAssistant instance.
+
+    Returns:
+        The task of every request in flight, and whether it includes the
+        device data.
+
+    """
+    return hass.data.setdefault(DOMAIN, {}).setdefault(DATA_REQUESTS, {})
+
+
+def async_get_snapshot_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, Any]]:
+    """Return the store holding the last snapshot of a config entry.
+
+    Args:
+        hass: The HomeAssistant instance.
+        entry_id: The id of the config entry.
+
+    Returns:
+        The snapshot store.
+
+    """
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+def _from_dict[T](cls: type[T], data: dict[str, Any]) -> T:
+    """Create a data object from a stored dict, ignoring unknown fields.
+
+    Args:
+        cls: The dataclass to create.
+        data: The stored fields.
+
+    Returns:
+        The created data object.
+
+    """
+    names = {field.name for field in dataclasses.fields(cls)}  # type: ignore[arg-type]
+    return cls(**{key: value for key, value in data.items() if key in names})
+
+
+def _entry_hash(entry_id: str) -> bytes:
+    """Return a stable hash of a config entry id.
+
+    Args:
+        entry_id: The id of the config entry.
+
+    Returns:
+        The hash digest.
+
+    """
+    return hashlib.sha256(entry_id.encode()).digest()
+
+
 class OmnikInverterDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Omnik Inverter data from single endpoint."""
 
@@ -46,40 +187,455 @@ class OmnikInverterDataUpdateCoordinator(DataUpdateCoordinator):
             entry: The ConfigEntry containing the user input.
 
         """
+        self._set_intervals(entry)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(
-                minutes=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+            update_interval=self.scan_interval,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=True,
             ),
         )
 
+        self.aggregator: SampleAggregator | None = None
+        self.energy = EnergyIntegrator(
+            max_gap=ENERGY_MAX_GAP_FACTOR
+            * (self.sample_interval or self.scan_interval),
+            resolution=ENERGY_RESOLUTION,
+        )
+        self.updated_services: frozenset[str] = frozenset()
+        self.refreshes = 0
+        self.monitoring = EntryMonitoring()
+        self._device_updated_at: float | None = None
+        self._fetch_task: asyncio.Task[OmnikInverterData] | None = None
+        self._processed: tuple[OmnikInverterData, OmnikInverterData] | None = None
+        self._host_lock = async_get_host_lock(hass, self.config_entry.data[CONF_HOST])
+        self._unsub_sampling: CALLBACK_TYPE | None = None
+        self._store = async_get_snapshot_store(hass, entry.entry_id)
+        self.restored = False
+
+        entry_ids = [
+            config_entry.entry_id
+            for config_entry in hass.config_entries.async_entries(DOMAIN)
+        ]
+        self.startup_delay = timedelta(
+            seconds=STARTUP_STAGGER * entry_ids.index(entry.entry_id)
+            if entry.entry_id in entry_ids
+            else 0
+        )
+
+        self._client_config = self._get_client_config()
+        self.omnikinverter = self._get_client()
+
+        self._async_schedule_sampling()
+
+    def _set_intervals(self, entry: ConfigEntry) -> None:
+        """Set the refresh and sample intervals from the options.
+
+        Args:
+            entry: The ConfigEntry containing the user input.
+
+        """
+        self.scan_interval = timedelta(
+            minutes=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self.device_update_interval = timedelta(
+            minutes=entry.options.get(
+                CONF_DEVICE_SCAN_INTERVAL, DEFAULT_DEVICE_SCAN_INTERVAL
+            )
+        )
+        self.sample_interval = timedelta(
+            seconds=entry.options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+        )
+
+    def _get_client_config(self) -> tuple[Any, ...]:
+        """Return the user input the client is created from.
+
+        Returns:
+            The normalized host, source type, credentials and serial number.
+
+        """
+        data = self.config_entry.data
+        return (
+            data[CONF_HOST].strip().lower(),
+            data[CONF_SOURCE_TYPE],
+            data.get(CONF_USERNAME),
+            data.get(CONF_PASSWORD),
+            data.get(CONF_SERIAL),
+        )
+
+    def _get_client(self) -> OmnikInverter:
+        """Return the client shared by all entries with the same user input.
+
+        Returns:
+            The client of the omnikinverter library.
+
+        """
+        clients: WeakValueDictionary[tuple[Any, ...], OmnikInverter] = (
+            self.hass.data.setdefault(DOMAIN, {}).setdefault(
+                DATA_CLIENTS, WeakValueDictionary()
+            )
+        )
+        if (client := clients.get(self._client_config)) is None:
+            client = clients[self._client_config] = self._create_client()
+        return client
+
+    def _create_client(self) -> OmnikInverter:
+        """Create the client for the configured logger.
+
+        Returns:
+            The client of the omnikinverter library, using the shared
+            HTTP session of Home Assistant.
+
+        """
+        session = async_get_clientsession(self.hass)
         if self.config_entry.data[CONF_SOURCE_TYPE] == "html":
-            self.omnikinverter = OmnikInverter(
+            return OmnikInverter(
                 host=self.config_entry.data[CONF_HOST],
                 source_type=self.config_entry.data[CONF_SOURCE_TYPE],
                 username=self.config_entry.data[CONF_USERNAME],
                 password=self.config_entry.data[CONF_PASSWORD],
+                session=session,
             )
-        elif self.config_entry.data[CONF_SOURCE_TYPE] == "tcp":
-            self.omnikinverter = OmnikInverter(
+        if self.config_entry.data[CONF_SOURCE_TYPE] == "tcp":
+            return OmnikInverter(
                 host=self.config_entry.data[CONF_HOST],
                 source_type=self.config_entry.data[CONF_SOURCE_TYPE],
                 serial_number=self.config_entry.data[CONF_SERIAL],
+                session=session,
             )
-        else:
-            self.omnikinverter = OmnikInverter(
-                host=self.config_entry.data[CONF_HOST],
-                source_type=self.config_entry.data[CONF_SOURCE_TYPE],
+        return OmnikInverter(
+            host=self.config_entry.data[CONF_HOST],
+            source_type=self.config_entry.data[CONF_SOURCE_TYPE],
+            session=session,
+        )
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Apply changed options and user input without reloading the entry.
+
+        The refresh and sampling are rescheduled on the new intervals. The
+        client is only rebuilt, and a refresh requested, when the host,
+        credentials or serial number changed. The entities stay in place.
+        """
+        self._set_intervals(self.config_entry)
+        self.energy.max_gap = ENERGY_MAX_GAP_FACTOR * (
+            self.sample_interval or self.scan_interval
+        )
+        self._async_schedule_sampling()
+        if self._listeners:
+            self._schedule_refresh()
+
+        client_config = self._get_client_config()
+        if client_config == self._client_config:
+            return
+
+        self._client_config = client_config
+        self.omnikinverter = self._get_client()
+        self._host_lock = async_get_host_lock(
+            self.hass, self.config_entry.data[CONF_HOST]
+        )
+        self._device_updated_at = None
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_request_refresh(),
+            f"{DOMAIN} {self.config_entry.title} refresh",
+        )
+
+    async def async_restore_snapshot(self) -> bool:
+        """Seed the coordinator with the last snapshot stored on disk.
+
+        Returns:
+            True if a snapshot was restored.
+
+        """
+        snapshot = await self._store.async_load()
+        if not snapshot:
+            return False
+
+        try:
+            self.data = {
+                SERVICE_INVERTER: _from_dict(Inverter, snapshot[SERVICE_INVERTER]),
+                SERVICE_DEVICE: _from_dict(Device, snapshot[SERVICE_DEVICE]),
+            }
+        except (KeyError, TypeError):
+            _LOGGER.warning("Ignoring invalid snapshot for %s", self.config_entry.title)
+            return False
+
+        self.energy.restore(snapshot.get("energy", {}))
+        self.monitoring.alarm = decode_alarm(self.data[SERVICE_INVERTER].alarm_code)
+        self.restored = True
+        return True
+
+    @property
+    def phase_offset(self) -> timedelta:
+        """Return the offset of the refresh slots of this entry.
+
+        The entries are ordered by a hash of their id and spread evenly
+        over the scan interval, so they do not all poll at once.
+
+        Returns:
+            The offset within the scan interval.
+
+        """
+        entry_ids = sorted(
+            (
+                config_entry.entry_id
+                for config_entry in self.hass.config_entries.async_entries(DOMAIN)
+            ),
+            key=_entry_hash,
+        )
+        if self.config_entry.entry_id not in entry_ids:
+            return timedelta(0)
+        return (
+            self.scan_interval
+            * entry_ids.index(self.config_entry.entry_id)
+            / len(entry_ids)
+        )
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh in the next slot of this entry.
+
+        Slots are one scan interval apart, shifted by the phase offset,
+        with a small random jitter. A slot closer than half an interval
+        is skipped, e.g. after a requested refresh.
+        """
+        interval = self.scan_interval.total_seconds()
+        elapsed = (self.hass.loop.time() - self.phase_offset.total_seconds()) % interval
+        delay = (
+            interval - elapsed + random.uniform(-SCHEDULE_JITTER, SCHEDULE_JITTER)  # noqa: S311
+        )
+        if delay < interval / 2:
+            delay += interval
+        self.update_interval = timedelta(seconds=delay)
+        super()._schedule_refresh()
+
+    async def async_background_first_refresh(self) -> None:
+        """Refresh for the first time without holding up the setup.
+
+        The first refreshes of multiple entries are staggered by their
+        `startup_delay`, so not all loggers are requested at once.
+        """
+        await asyncio.sleep(self.startup_delay.total_seconds())
+        await self.async_refresh()
+
+    async def _async_refresh(
+        self,
+        log_failures: bool = True,  # noqa: FBT001, FBT002
+        raise_on_auth_failed: bool = False,  # noqa: FBT001, FBT002
+        scheduled: bool = False,  # noqa: FBT001, FBT002
+        raise_on_entry_error: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        """Refresh the data, profiling the refresh if a capture is running."""
+        handle = self.monitoring.profiler.begin()
+        writes = self.monitoring.metrics.writes
+        try:
+            await super()._async_refresh(
+                log_failures, raise_on_auth_failed, scheduled, raise_on_entry_error
+            )
+        finally:
+            self.monitoring.profiler.end(
+                handle, writes=self.monitoring.metrics.writes - writes
             )
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all entities, timing the fan-out while profiling."""
+        with self.monitoring.profiler.phase(PHASE_FAN_OUT):
+            super().async_update_listeners()
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Schedule a write of the snapshot after a successful refresh."""
+        self.refreshes += 1
+        if not self.last_update_success:
+            return
+        self.restored = False
+        self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the snapshot to store on disk.
+
+        Returns:
+            The current inverter and device data and the energy counter.
+
+        """
+        return {
+            SERVICE_INVERTER: dataclasses.asdict(self.data[SERVICE_INVERTER]),
+            SERVICE_DEVICE: dataclasses.asdict(self.data[SERVICE_DEVICE]),
+            "energy": self.energy.as_dict(),
+        }
+
+    @callback
+    def _async_schedule_sampling(self) -> None:
+        """(Re)start sampling the inverter in between refreshes.
+
+        When a sample interval is set, the inverter is polled at that rate
+        and the samples are aggregated into the values published on every
+        refresh, without writing each sample to the state machine.
+        """
+        if self._unsub_sampling is not None:
+            self._unsub_sampling()
+            self._unsub_sampling = None
+
+        if not self.sample_interval:
+            self.aggregator = None
+            return
+
+        if self.aggregator is None:
+            self.aggregator = SampleAggregator()
+        self._unsub_sampling = async_track_time_interval(
+            self.hass,
+            self._async_sample,
+            self.sample_interval,
+            name=f"{DOMAIN} {self.config_entry.title} sample",
+            cancel_on_shutdown=True,
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call, including sampling."""
+        await super().async_shutdown()
+        if self._unsub_sampling is not None:
+            self._unsub_sampling()
+            self._unsub_sampling = None
+
+    async def _async_sample(self, _now: datetime) -> None:
+        """Take an inverter sample for the aggregator.
+
+        Args:
+            _now: The time of the sample.
+
+        """
+        if self.data is None or not self.last_update_success:
+            return
+        try:
+            await self._async_fetch_shared(include_device=False)
+        except (ConfigEntryAuthFailed, UpdateFailed) as error:
+            _LOGGER.debug("Failed to sample the Omnik: %s", error)
+
     async def _async_update_data(self) -> OmnikInverterData:
         """Fetch data from the omnik inverter.
 
+        Refreshes that are requested while a fetch is still in flight do
+        not start a new one, they wait for and share the running fetch.
+        Every fetch is processed once, so the samples are published and
+        the alarm and strings are updated once, however many refreshes
+        share it.
+
+        Returns:
+            An object containing the serial number as a key, and
+            the resource as a value.
+
+        """
+        self.monitoring.alarm_transition = None
+        fetched = await self._async_fetch_shared(include_device=True)
+        if self._processed is not None and self._processed[0] is fetched:
+            # Another refresh sharing the fetch already processed it.
+            self.updated_services = frozenset()
+            return self._processed[1]
+
+        data = fetched
+        services = {SERVICE_INVERTER}
+        if self.data is None or data[SERVICE_DEVICE] is not self.data[SERVICE_DEVICE]:
+            services.add(SERVICE_DEVICE)
+        self.updated_services = frozenset(services)
+
+        if self.aggregator is not None:
+            data = {
+                SERVICE_INVERTER: self.aggregator.publish(data[SERVICE_INVERTER]),
+                SERVICE_DEVICE: data[SERVICE_DEVICE],
+            }
+
+        self._async_update_alarm(data[SERVICE_INVERTER])
+        self._async_update_strings(data[SERVICE_INVERTER])
+        self._processed = (fetched, data)
+        return data
+
+    @callback
+    def _async_update_alarm(self, inverter: Inverter) -> None:
+        """Detect a change of the alarm compared to the previous refresh.
+
+        A transition is fired on the bus and kept in `alarm_transition`
+        until the next refresh, so entities can act on the edge only.
+
+        Args:
+            inverter: The refreshed inverter data.
+
+        """
+        alarm = decode_alarm(inverter.alarm_code)
+        if alarm != self.monitoring.alarm and self.data is not None:
+            self.monitoring.alarm_transition = AlarmTransition(
+                previous=self.monitoring.alarm, current=alarm
+            )
+            self.hass.bus.async_fire(
+                EVENT_ALARM,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "serial_number": inverter.serial_number,
+                    "type": self.monitoring.alarm_transition.event_type,
+                    **self.monitoring.alarm_transition.as_dict(),
+                },
+            )
+        self.monitoring.alarm = alarm
+
+    @callback
+    def _async_update_strings(self, inverter: Inverter) -> None:
+        """Feed the DC strings to the monitor and fire events on changes.
+
+        Args:
+            inverter: The refreshed inverter data.
+
+        """
+        for index, baseline in self.monitoring.strings.update(inverter):
+            self.hass.bus.async_fire(
+                EVENT_STRING_ANOMALY,
+                {
+                    "entry_id": self.config_entry.entry_id,
+                    "serial_number": inverter.serial_number,
+                    "type": EVENT_ANOMALY_DETECTED
+                    if baseline.flagged
+                    else EVENT_ANOMALY_CLEARED,
+                    "string": index + 1,
+                    **baseline.as_dict(),
+                },
+            )
+
+    async def _async_fetch_shared(self, *, include_device: bool) -> OmnikInverterData:
+        """Fetch data, sharing a fetch that is already in flight.
+
+        Args:
+            include_device: Whether device data may be requested if it is due.
+
+        Returns:
+            The fetched data.
+
+        """
+        if self._fetch_task is None or self._fetch_task.done():
+            self._fetch_task = self.hass.async_create_task(
+                self._async_fetch_data(include_device=include_device),
+                f"{DOMAIN} {self.config_entry.title} fetch",
+            )
+        return await asyncio.shield(self._fetch_task)
+
+    async def _async_fetch_data(self, *, include_device: bool) -> OmnikInverterData:
+        """Fetch data from the omnik inverter.
+
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
 
+        The device information changes slowly, so it is only requested
+        once every `device_update_interval`; in between the previous
+        device data is carried over.
+
+        Args:
+            include_device: Whether device data may be requested if it is due.
+
         Returns:
             An object containing the serial number as a key, and
             the resource as a value.
@@ -89,15 +645,187 @@ class OmnikInverterDataUpdateCoordinator(DataUpdateCoordinator):
             UpdateFailed: An error occurred when updating the data.
 
         """
+        request_device = include_device and self._device_update_due()
         try:
-            data: OmnikInverterData = {
-                SERVICE_INVERTER: await self.omnikinverter.inverter(),
-                SERVICE_DEVICE: await self.omnikinverter.device(),
-            }
+            with self.monitoring.profiler.phase(PHASE_REQUEST):
+                inverter, device = await self._async_shared_request(
+                    include_device=request_device
+                )
         except OmnikInverterAuthError as error:
-            _LOGGER.exception("Failed to authenticate with the Omnik")
+            self.monitoring.metrics.failures[type(error).__name__] += 1
+            _LOGGER.debug("Failed to authenticate with the Omnik: %s", error)
             raise ConfigEntryAuthFailed from error
         except OmnikInverterError as error:
-            _LOGGER.exception("Failed to connect to the Omnik")
+            self.monitoring.metrics.failures[type(error).__name__] += 1
+            _LOGGER.debug("Failed to connect to the Omnik: %s", error)
             raise UpdateFailed(error) from error
-        return data
+
+        if device is not None:
+            # A request shared with another entry may bring device data that
+            # was not asked for, it is used but does not postpone the update.
+            if request_device:
+                self._device_updated_at = monotonic()
+        elif self.data is not None:
+            device = self.data[SERVICE_DEVICE]
+        else:
+            device = Device()
+
+        with self.monitoring.profiler.phase(PHASE_PROCESS):
+            now = dt_util.utcnow()
+            self.monitoring.history.append((now, inverter))
+            self.energy.add(now, inverter.solar_current_power)
+            self.energy.reconcile(
+                inverter.solar_energy_today, inverter.solar_energy_total
+            )
+            if self.aggregator is not None:
+                self.aggregator.add(inverter)
+        return {SERVICE_INVERTER: inverter, SERVICE_DEVICE: device}
+
+    async def _async_shared_request(self, *, include_device: bool) -> RequestResult:
+        """Request the data, or join a request in flight for the same client.
+
+        Entries with the same host, source type and credentials share the
+        result of a single request, when it includes the device data or
+        the device data is not needed.
+
+        Args:
+            include_device: Whether to request the device data as well.
+
+        Returns:
+            The inverter data, and the device data if requested and fetched.
+
+        """
+        requests = async_get_requests(self.hass)
+        key = self._client_config
+        if (
+            (shared := requests.get(key)) is not None
+            and not shared[0].done()
+            and (shared[1] or not include_device)
+        ):
+            self.monitoring.metrics.polls_shared += 1
+            return await asyncio.shield(shared[0])
+
+        task = self.hass.async_create_task(
+            self._async_locked_request(include_device=include_device),
+            f"{DOMAIN} {self.config_entry.title} request",
+        )
+        requests[key] = (task, include_device)
+
+        def _remove(_task: asyncio.Task[RequestResult]) -> None:
+            if key in requests and requests[key][0] is task:
+                del requests[key]
+
+        task.add_done_callback(_remove)
+        return await asyncio.shield(task)
+
+    async def _async_locked_request(self, *, include_device: bool) -> RequestResult:
+        """Request the data while holding the lock of the host.
+
+        Args:
+            include_device: Whether to request the device data as well.
+
+        Returns:
+            The inverter data, and the device data if requested and fetched.
+
+        """
+        async with self._host_lock:
+            self.monitoring.metrics.polls += 1
+            started = monotonic()
+            try:
+                return await self._async_request(include_device=include_device)
+            finally:
+                self.monitoring.metrics.latency.observe(monotonic() - started)
+
+    async def _async_request(self, *, include_device: bool) -> RequestResult:
+        """Request the inverter data, and the device data if requested.
+
+        The raw TCP reply and the status pages are decoded by the
+        integration itself, a status page serves both the inverter and
+        the device data from a single request. The JSON status is requested
+        with the library client and parsed by its models, with separate
+        requests for the inverter and the device data.
+
+        All requests of a refresh share a single deadline per source type.
+        When only the device request fails, the new inverter data is
+        returned without device data.
+
+        Args:
+            include_device: Whether to request the device data as well.
+
+        Returns:
+            The inverter data, and the device data if requested and fetched.
+
+        Raises:
+            OmnikInverterConnectionError: The inverter request timed out.
+
+        """
+        source_type = self.config_entry.data[CONF_SOURCE_TYPE]
+        deadline = self.hass.loop.time() + REFRESH_DEADLINES[source_type]
+        try:
+            async with asyncio.timeout_at(deadline):
+                if source_type == "tcp":
+                    inverter = await async_request_inverter(
+                        self.config_entry.data[CONF_HOST],
+                        self.config_entry.data[CONF_SERIAL],
+                        on_receive=self.monitoring.metrics.add_received,
+                        decode_timer=self.monitoring.profiler.decode,
+                    )
+                    # None of the device fields are available over TCP.
+                    return inverter, Device() if include_device else None
+                if source_type != "json":
+                    return await async_request_status_page(
+                        async_get_clientsession(self.hass),
+                        self.config_entry.data[CONF_HOST],
+                        source_type,
+                        include_device=include_device,
+                        username=self.config_entry.data.get(CONF_USERNAME),
+                        password=self.config_entry.data.get(CONF_PASSWORD),
+                        on_receive=self.monitoring.metrics.add_received,
+                        decode_timer=self.monitoring.profiler.decode,
+                    )
+                inverter = await self._async_request_json(Inverter.from_json)
+        except TimeoutError as exception:
+            msg = "Timeout occurred while communicating with the Omnik Inverter device"
+            raise OmnikInverterConnectionError(msg) from exception
+
+        if not include_device:
+            return inverter, None
+        try:
+            async with asyncio.timeout_at(deadline):
+                return inverter, await self._async_request_json(Device.from_json)
+        except (TimeoutError, OmnikInverterConnectionError) as error:
+            # Publish the new inverter data, the device data is kept and
+            # requested again on the next refresh.
+            _LOGGER.debug("Failed to fetch the device data of the Omnik: %s", error)
+            return inverter, None
+
+    async def _async_request_json[T](self, parse: Callable[[dict[str, Any]], T]) -> T:
+        """Request the JSON status of the logger with the library client.
+
+        Args:
+            parse: Creates the inverter or device data from the status.
+
+        Returns:
+            The parsed status.
+
+        """
+        data = await self.omnikinverter.request(
+            "status.json", params={"CMD": "inv_query"}
+        )
+        with self.monitoring.profiler.decode():
+            return parse(json.loads(data))
+
+    def _device_update_due(self) -> bool:
+        """Return whether the device information should be requested.
+
+        Returns:
+            True if no device data is known yet or the device
+            update interval has passed.
+
+        """
+        return (
+            self.data is None
+            or self._device_updated_at is None
+            or monotonic() - self._device_updated_at
+            >= self.device_update_interval.total_seconds()
+        )
@@ -6,9 +6,16 @@ from dataclasses import asdict
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_IP_ADDRESS
 
-from .const import CONF_SERIAL, SERVICE_DEVICE, SERVICE_INVERTER
+from .const import (
+    CONF_SERIAL,
+    DOMAIN,
+    SCHEDULE_JITTER,
+    SERVICE_DEVICE,
+    SERVICE_INVERTER,
+)
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -18,8 +25,46 @@ if TYPE_CHECKING:
 TO_REDACT = {CONF_HOST, CONF_IP_ADDRESS, CONF_SERIAL}
 
 
+def _schedule_diagnostics(
+    hass: HomeAssistant, entry: OmnikInverterConfigEntry
+) -> dict[str, Any]:
+    """Return the refresh schedule of an entry and its spread across entries.
+
+    Args:
+        hass: The HomeAssistant instance.
+        entry: The ConfigEntry containing the user input.
+
+    Returns:
+        The schedule of the entry and the gaps between the refresh slots
+        of all loaded entries within its scan interval.
+
+    """
+    coordinator = entry.runtime_data
+    interval = coordinator.scan_interval.total_seconds()
+    phases = sorted(
+        config_entry.runtime_data.phase_offset.total_seconds() % interval
+        for config_entry in hass.config_entries.async_entries(DOMAIN)
+        if config_entry.state is ConfigEntryState.LOADED
+    )
+    gaps = [
+        (phases[(index + 1) % len(phases)] - phase) % interval or interval
+        for index, phase in enumerate(phases)
+    ]
+
+    return {
+        "scan_interval": interval,
+        "phase_offset": coordinator.phase_offset.total_seconds(),
+        "jitter": SCHEDULE_JITTER,
+        "spread": {
+            "entries": len(phases),
+            "min_gap": min(gaps, default=None),
+            "max_gap": max(gaps, default=None),
+        },
+    }
+
+
 async def async_get_config_entry_diagnostics(
-    _hass: HomeAssistant, entry: OmnikInverterConfigEntry
+    hass: HomeAssistant, entry: OmnikInverterConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry.
 
@@ -42,5 +87,9 @@ async def async_get_config_entry_diagnostics(
         "data": {
             "device": asdict(coordinator.data[SERVICE_DEVICE]),
             "inverter": asdict(coordinator.data[SERVICE_INVERTER]),
-        },
+        }
+        if coordinator.data is not None
+        else None,
+        "schedule": _schedule_diagnostics(hass, entry),
+        "profile": coordinator.monitoring.profiler.as_dict(),
     }
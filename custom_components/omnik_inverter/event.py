@@ -0,0 +1,93 @@
+"""Support for Omnik Inverter events."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components.event import EventEntity, EventEntityDescription
+from homeassistant.core import callback
+from homeassistant.util import slugify
+
+from .alarms import EVENT_ALARM_CLEARED, EVENT_ALARM_RAISED
+from .const import SERVICE_INVERTER
+from .models import OmnikInverterEntity
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from . import OmnikInverterConfigEntry
+    from .coordinator import OmnikInverterDataUpdateCoordinator
+
+ALARM_EVENT = EventEntityDescription(
+    key="alarm",
+    name="Alarm",
+    icon="mdi:alert",
+    event_types=[EVENT_ALARM_RAISED, EVENT_ALARM_CLEARED],
+)
+
+
+async def async_setup_entry(
+    _hass: HomeAssistant,
+    entry: OmnikInverterConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Load the Omnik Inverter events.
+
+    Args:
+        _hass: The HomeAssistant instance.
+        entry: The ConfigEntry containing the user input.
+        async_add_entities: The callback to provide the created entities to.
+
+    """
+    async_add_entities(
+        [
+            OmnikInverterAlarmEvent(
+                entry.runtime_data,
+                name=entry.title,
+                description=ALARM_EVENT,
+                service=SERVICE_INVERTER,
+            )
+        ]
+    )
+
+
+class OmnikInverterAlarmEvent(OmnikInverterEntity, EventEntity):
+    """Defines an event entity firing on alarm transitions of the inverter."""
+
+    entity_description: EventEntityDescription
+
+    def __init__(
+        self,
+        coordinator: OmnikInverterDataUpdateCoordinator,
+        name: str,
+        description: EventEntityDescription,
+        service: str,
+    ) -> None:
+        """Initialise the entity.
+
+        Args:
+            coordinator: The data coordinator updating the models.
+            name: The identifier for this entity.
+            description: The entity description for the event.
+            service: The service to create the event for.
+
+        """
+        super().__init__(coordinator=coordinator, name=name, service=service)
+
+        self.entity_description = description
+
+        self._attr_unique_id = slugify(
+            f"{self.entry_id}_{service}_{self.entity_description.key}"
+        )
+        self._attr_name = f"{name} {self.entity_description.name}"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Trigger an event when the coordinator detected an alarm transition."""
+        transition = self.coordinator.monitoring.alarm_transition
+        if transition is None:
+            super()._handle_coordinator_update()
+            return
+        self._trigger_event(transition.event_type, transition.as_dict())
+        self.async_write_ha_state()
@@ -0,0 +1,231 @@
+"""Export of the raw inverter snapshots for time-series databases."""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from datetime import datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.util import dt as dt_util
+
+from omnikinverter import Inverter
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from . import OmnikInverterConfigEntry
+
+EXPORT_URL = "/api/omnik_inverter/export"
+
+FORMAT_LINE_PROTOCOL = "influx"
+FORMAT_PROMETHEUS = "prometheus"
+CONTENT_TYPES = {
+    FORMAT_LINE_PROTOCOL: "text/plain; charset=utf-8",
+    FORMAT_PROMETHEUS: "text/plain; version=0.0.4; charset=utf-8",
+}
+
+INVERTER_FIELDS = tuple(field.name for field in dataclasses.fields(Inverter))
+
+type Snapshots = Iterable[tuple[datetime, Inverter]]
+type Series = tuple[dict[str, str], Snapshots]
+
+
+def _values(inverter: Inverter) -> Iterator[tuple[str, int | None, int | float]]:
+    """Return the numeric values of an inverter snapshot.
+
+    Args:
+        inverter: The inverter snapshot.
+
+    Yields:
+        The field name, the 1-based index for list fields and the value.
+
+    """
+    for name in INVERTER_FIELDS:
+        value = getattr(inverter, name)
+        if isinstance(value, list):
+            for index, item in enumerate(value, 1):
+                if isinstance(item, int | float) and math.isfinite(item):
+                    yield name, index, item
+        elif isinstance(value, bool):
+            yield name, None, int(value)
+        elif isinstance(value, int | float) and math.isfinite(value):
+            yield name, None, value
+
+
+def _escape_tag(value: str) -> str:
+    """Escape a tag key or value of the line protocol.
+
+    Args:
+        value: The tag key or value.
+
+    Returns:
+        The escaped value.
+
+    """
+    for character in "\\, =":
+        value = value.replace(character, f"\\{character}")
+    return value
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value of the Prometheus exposition format.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        The escaped value.
+
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_line_protocol(series: Iterable[Series]) -> str:
+    """Format snapshots in the InfluxDB line protocol.
+
+    Every snapshot is a single line with all its values as fields,
+    list fields get their 1-based index as suffix.
+
+    Args:
+        series: The labels and snapshots of every entry.
+
+    Returns:
+        The snapshots, one per line, with nanosecond timestamps.
+
+    """
+    lines = []
+    for labels, snapshots in series:
+        tags = ",".join(
+            f"{_escape_tag(key)}={_escape_tag(value)}"
+            for key, value in labels.items()
+            if value
+        )
+        for timestamp, inverter in snapshots:
+            fields = ",".join(
+                f"{name}{'' if index is None else f'_{index}'}="
+                f"{value}{'i' if isinstance(value, int) else ''}"
+                for name, index, value in _values(inverter)
+            )
+            if fields:
+                nanoseconds = int(timestamp.timestamp() * 1_000_000) * 1000
+                lines.append(f"{DOMAIN},{tags} {fields} {nanoseconds}")
+    return "".join(f"{line}\n" for line in lines)
+
+
+def format_prometheus(series: Iterable[Series]) -> str:
+    """Format snapshots in the Prometheus text exposition format.
+
+    Samples are grouped per metric, list fields get an `index` label.
+
+    Args:
+        series: The labels and snapshots of every entry.
+
+    Returns:
+        A gauge per inverter field, with millisecond timestamps.
+
+    """
+    metrics: dict[str, list[str]] = {}
+    for labels, snapshots in series:
+        base = ",".join(
+            f'{key}="{escape_label(value)}"' for key, value in labels.items() if value
+        )
+        for timestamp, inverter in snapshots:
+            milliseconds = int(timestamp.timestamp() * 1000)
+            for name, index, value in _values(inverter):
+                label = base if index is None else f'{base},index="{index}"'
+                metrics.setdefault(name, []).append(
+                    f"{DOMAIN}_{name}{{{label}}} {value} {milliseconds}"
+                )
+
+    lines = []
+    for name, samples in metrics.items():
+        lines.append(f"# TYPE {DOMAIN}_{name} gauge")
+        lines.extend(samples)
+    return "".join(f"{line}\n" for line in lines)
+
+
+FORMATTERS = {
+    FORMAT_LINE_PROTOCOL: format_line_protocol,
+    FORMAT_PROMETHEUS: format_prometheus,
+}
+
+
+def _series(entry: OmnikInverterConfigEntry, since: datetime | None) -> Series:
+    """Return the labels and the snapshots of an entry.
+
+    Args:
+        entry: The ConfigEntry containing the user input.
+        since: Only return snapshots taken after this time.
+
+    Returns:
+        The labels of the entry and its snapshots.
+
+    """
+    history = entry.runtime_data.monitoring.history
+    serial_number = history[-1][1].serial_number if history else None
+    labels = {
+        "entry_id": entry.entry_id,
+        "name": entry.title,
+        "serial_number": serial_number or "",
+    }
+    if since is None:
+        return labels, list(history)
+    return labels, [snapshot for snapshot in history if snapshot[0] > since]
+
+
+class OmnikInverterExportView(HomeAssistantView):
+    """Serve the raw inverter snapshots of all or a single entry."""
+
+    url = EXPORT_URL
+    name = "api:omnik_inverter:export"
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the snapshots in the requested format.
+
+        The `format` query parameter selects `influx` (default) or
+        `prometheus`, `entry_id` limits the export to a single entry and
+        `since` to the snapshots taken after a UNIX timestamp.
+
+        Args:
+            request: The HTTP request.
+
+        Returns:
+            The formatted snapshots.
+
+        """
+        hass = request.app[KEY_HASS]
+        export_format = request.query.get("format", FORMAT_LINE_PROTOCOL)
+        if export_format not in FORMATTERS:
+            return self.json_message(
+                f"Unknown format {export_format}", HTTPStatus.BAD_REQUEST
+            )
+
+        entry_id = request.query.get("entry_id")
+        since = None
+        if "since" in request.query:
+            try:
+                since = dt_util.utc_from_timestamp(float(request.query["since"]))
+            except (ValueError, OverflowError):
+                return self.json_message("Invalid since", HTTPStatus.BAD_REQUEST)
+
+        entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+            and entry_id in (None, entry.entry_id)
+        ]
+        if entry_id is not None and not entries:
+            return self.json_message("Entry not found", HTTPStatus.NOT_FOUND)
+
+        body = FORMATTERS[export_format](_series(entry, since) for entry in entries)
+        return web.Response(
+            body=body.encode(),
+            headers={"Content-Type": CONTENT_TYPES[export_format]},
+        )
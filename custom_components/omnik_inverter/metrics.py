@@ -0,0 +1,175 @@
+"""Operational metrics of the Omnik Inverter integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+
+from .const import DOMAIN
+from .export import CONTENT_TYPES, FORMAT_PROMETHEUS, escape_label
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+METRICS_URL = "/api/omnik_inverter/metrics"
+
+# Upper bounds in seconds of the request duration histogram buckets.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass(slots=True)
+class Histogram:
+    """A histogram with fixed buckets."""
+
+    buckets: tuple[float, ...]
+    counts: list[int] = field(init=False)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Initialise the bucket counts."""
+        self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Add an observation to the histogram.
+
+        Args:
+            value: The observed value.
+
+        """
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+
+@dataclass(slots=True)
+class EntryMetrics:
+    """Counters of the polls and entity writes of a single entry."""
+
+    polls: int = 0
+    polls_shared: int = 0
+    failures: Counter[str] = field(default_factory=Counter)
+    bytes_received: int = 0
+    writes: int = 0
+    writes_suppressed: int = 0
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+
+    def add_received(self, size: int) -> None:
+        """Count received bytes.
+
+        Args:
+            size: The number of bytes received.
+
+        """
+        self.bytes_received += size
+
+
+def format_metrics(entries: Iterable[tuple[dict[str, str], EntryMetrics]]) -> str:
+    """Format the metrics of entries in the Prometheus text exposition format.
+
+    Args:
+        entries: The labels and metrics of every entry.
+
+    Returns:
+        The metrics, grouped per metric family.
+
+    """
+    families: dict[str, tuple[str, str, list[str]]] = {
+        "polls_total": ("counter", "Polls of the inverter.", []),
+        "polls_shared_total": (
+            "counter",
+            "Polls answered by a request of another entry.",
+            [],
+        ),
+        "poll_failures_total": ("counter", "Failed polls by error.", []),
+        "request_duration_seconds": ("histogram", "Duration of the polls.", []),
+        "received_bytes_total": ("counter", "Bytes received from the logger.", []),
+        "entity_writes_total": ("counter", "Entity state writes.", []),
+        "entity_writes_suppressed_total": (
+            "counter",
+            "Entity state writes skipped by the integration.",
+            [],
+        ),
+    }
+
+    def sample(family: str, labels: str, value: float, suffix: str = "") -> None:
+        families[family][2].append(f"{DOMAIN}_{family}{suffix}{{{labels}}} {value}")
+
+    for labels, metrics in entries:
+        base = ",".join(
+            f'{key}="{escape_label(value)}"' for key, value in labels.items()
+        )
+        sample("polls_total", base, metrics.polls)
+        sample("polls_shared_total", base, metrics.polls_shared)
+        for error, count in sorted(metrics.failures.items()):
+            sample("poll_failures_total", f'{base},error="{error}"', count)
+
+        cumulative = 0
+        for bound, count in zip(
+            metrics.latency.buckets, metrics.latency.counts, strict=True
+        ):
+            cumulative += count
+            sample(
+                "request_duration_seconds",
+                f'{base},le="{bound}"',
+                cumulative,
+                "_bucket",
+            )
+        sample(
+            "request_duration_seconds",
+            f'{base},le="+Inf"',
+            metrics.latency.count,
+            "_bucket",
+        )
+        sample("request_duration_seconds", base, metrics.latency.total, "_sum")
+        sample("request_duration_seconds", base, metrics.latency.count, "_count")
+
+        sample("received_bytes_total", base, metrics.bytes_received)
+        sample("entity_writes_total", base, metrics.writes)
+        sample("entity_writes_suppressed_total", base, metrics.writes_suppressed)
+
+    lines = []
+    for family, (metric_type, description, samples) in families.items():
+        lines.append(f"# HELP {DOMAIN}_{family} {description}")
+        lines.append(f"# TYPE {DOMAIN}_{family} {metric_type}")
+        lines.extend(samples)
+    return "".join(f"{line}\n" for line in lines)
+
+
+class OmnikInverterMetricsView(HomeAssistantView):
+    """Serve the operational metrics of all entries."""
+
+    url = METRICS_URL
+    name = "api:omnik_inverter:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics in the Prometheus text exposition format.
+
+        Args:
+            request: The HTTP request.
+
+        Returns:
+            The metrics of all loaded entries.
+
+        """
+        hass = request.app[KEY_HASS]
+        body = format_metrics(
+            (
+                {"entry_id": entry.entry_id, "name": entry.title},
+                entry.runtime_data.monitoring.metrics,
+            )
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        )
+        return web.Response(
+            body=body.encode(),
+            headers={"Content-Type": CONTENT_TYPES[FORMAT_PROMETHEUS]},
+        )
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
 from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -12,6 +15,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, MANUFACTURER, SERVICE_DEVICE, SERVICE_INVERTER
 from .coordinator import OmnikInverterDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import timedelta
+
 
 class OmnikInverterEntity(CoordinatorEntity[OmnikInverterDataUpdateCoordinator]):
     """Defines an Omnik Inverter Entity."""
@@ -20,6 +27,7 @@ class OmnikInverterEntity(CoordinatorEntity[OmnikInverterDataUpdateCoordinator])
     coordinator: OmnikInverterDataUpdateCoordinator
     service: str
     entry_id: str
+    _written_available: bool | None = None
 
     def __init__(
         self,
@@ -41,6 +49,49 @@ class OmnikInverterEntity(CoordinatorEntity[OmnikInverterDataUpdateCoordinator])
         self.service = service
         self.entry_id = coordinator.config_entry.entry_id
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        Only write the state when the service this entity belongs to
+        was refreshed, or when the availability changed.
+        """
+        available = self.available
+        if available == self._written_available and (
+            self.service not in self.coordinator.updated_services
+            or not self._should_write_state()
+        ):
+            self.coordinator.monitoring.metrics.writes_suppressed += 1
+            return
+        self.coordinator.monitoring.metrics.writes += 1
+        self._written_available = available
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return if the entity is available.
+
+        Entities stay available with their restored values until the
+        first refresh after a restart succeeds. Without data, e.g. while
+        the first refresh runs in the background, they are unavailable.
+
+        Returns:
+            True if the last refresh succeeded or data was restored.
+
+        """
+        return (
+            super().available and self.coordinator.data is not None
+        ) or self.coordinator.restored
+
+    def _should_write_state(self) -> bool:
+        """Return whether refreshed data should be written to the state machine.
+
+        Returns:
+            True by default, entities can override this to filter writes.
+
+        """
+        return True
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return information to link this entity with the correct device.
@@ -50,19 +101,83 @@ class OmnikInverterEntity(CoordinatorEntity[OmnikInverterDataUpdateCoordinator])
             to the correct device.
 
         """
-        return DeviceInfo(
+        device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{self.entry_id}_{self.service}")},
             name=f"{self._name} {self.service.title()}",
             manufacturer=MANUFACTURER,
             entry_type=DeviceEntryType.SERVICE,
-            model=self.coordinator.data[SERVICE_INVERTER].model,
-            sw_version=self.coordinator.data[self.service].firmware,
-            configuration_url=f"http://{self.coordinator.data[SERVICE_DEVICE].ip_address}",
         )
+        if self.coordinator.data is not None:
+            device_info["model"] = self.coordinator.data[SERVICE_INVERTER].model
+            device_info["sw_version"] = self.coordinator.data[self.service].firmware
+            device_info["configuration_url"] = (
+                f"http://{self.coordinator.data[SERVICE_DEVICE].ip_address}"
+            )
+        return device_info
+
+
+@dataclass
+class OmnikInverterBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """A binary sensor entity description with its state from the coordinator."""
+
+    is_on_fn: Callable[[OmnikInverterDataUpdateCoordinator], bool | None] = (
+        lambda coordinator: coordinator.last_update_success
+    )
+    attributes_fn: (
+        Callable[[OmnikInverterDataUpdateCoordinator], dict[str, Any] | None] | None
+    ) = None
+
+
+@dataclass
+class OmnikInverterSensorEntityDescription(SensorEntityDescription):
+    """A sensor entity description with write filtering.
+
+    A new value is only written when it differs from the last written
+    value by at least the absolute `deadband` or the `deadband_relative`
+    fraction of that value, whichever is larger, and `min_interval` has
+    passed. Once `max_age` has passed the value is always written.
+
+    Sensors with a `value_fn` take their value from the coordinator
+    instead of the inverter or device data, `attributes_fn` adds state
+    attributes from the coordinator.
+    """
+
+    value_fn: Callable[[OmnikInverterDataUpdateCoordinator], Any] | None = None
+    attributes_fn: (
+        Callable[[OmnikInverterDataUpdateCoordinator], dict[str, Any] | None] | None
+    ) = None
+    deadband: float | None = None
+    deadband_relative: float | None = None
+    min_interval: timedelta | None = None
+    max_age: timedelta | None = None
+
+    def should_write(self, previous: Any, value: Any, elapsed: timedelta) -> bool:
+        """Return whether a value passes the write filter.
+
+        Args:
+            previous: The last written value.
+            value: The new value.
+            elapsed: The time since the last write.
+
+        Returns:
+            True if the new value should be written.
+
+        """
+        if not isinstance(previous, int | float) or not isinstance(value, int | float):
+            return True
+        if self.max_age is not None and elapsed >= self.max_age:
+            return True
+        if self.min_interval is not None and elapsed < self.min_interval:
+            return False
+
+        threshold = max(
+            self.deadband or 0.0, (self.deadband_relative or 0.0) * abs(previous)
+        )
+        return abs(value - previous) >= threshold
 
 
 @dataclass
-class RangedSensorEntityDescription(SensorEntityDescription):
+class RangedSensorEntityDescription(OmnikInverterSensorEntityDescription):
     """An extended sensor entity description."""
 
     size: range | None = None
@@ -0,0 +1,279 @@
+"""On-demand profiling of the refreshes of the Omnik Inverter integration."""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import PurePath
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+PROFILE_DEFAULT_REFRESHES = 5
+PROFILE_MAX_REFRESHES = 20
+# Number of functions with the most own time listed in a capture.
+PROFILE_TOP_FUNCTIONS = 25
+
+PHASE_REQUEST = "request"
+PHASE_PROCESS = "process"
+PHASE_FAN_OUT = "fan_out"
+
+
+# The timing of the refresh being captured in the current context.
+_REFRESH: ContextVar[RefreshTiming | None] = ContextVar(
+    "omnik_inverter_refresh", default=None
+)
+
+
+@dataclass(slots=True)
+class RefreshTiming:
+    """The time spent in the phases of a refresh."""
+
+    wall: dict[str, float] = field(default_factory=dict)
+    decode: float = 0.0
+    total: float = 0.0
+    writes: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing of the refresh.
+
+        Decoding is only timed in the synchronous sections that decode
+        the reply, the rest of the request is spent waiting on the network,
+        or on the event loop while it runs other tasks.
+
+        Returns:
+            The time per phase in milliseconds and the entity writes.
+
+        """
+        phases = {phase: round(wall * 1000, 3) for phase, wall in self.wall.items()}
+        if PHASE_REQUEST in self.wall:
+            phases["decode"] = round(self.decode * 1000, 3)
+            phases["network_wait"] = round(
+                max(self.wall[PHASE_REQUEST] - self.decode, 0) * 1000, 3
+            )
+        return {
+            "total_ms": round(self.total * 1000, 3),
+            "phases": phases,
+            "entity_writes": self.writes,
+        }
+
+
+@dataclass(slots=True)
+class RefreshHandle:
+    """The refresh that started profiling, to pass back to `end`."""
+
+    timing: RefreshTiming
+    token: Token[RefreshTiming | None]
+    started: float
+
+
+class RefreshProfiler:
+    """Profile the next refreshes of a coordinator.
+
+    While a capture is running, every refresh is timed per phase and runs
+    under `cProfile`. The profiler is only enabled during the refreshes
+    being captured, so it costs nothing otherwise. It sees everything the
+    event loop runs meanwhile, e.g. other integrations while a request
+    waits on the network, so the hot functions are not limited to this
+    integration.
+
+    The refresh being captured is tracked in a context variable, which
+    tasks started by the refresh inherit. Requests of other tasks, like
+    sampling in between refreshes, are not added to its timing. Refreshes
+    overlapping the one being profiled are not profiled themselves.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the profiler without a capture."""
+        self.requested = 0
+        self.refreshes: list[RefreshTiming] = []
+        self.hot_functions: list[dict[str, Any]] = []
+        self.note: str | None = None
+        self._profile: cProfile.Profile | None = None
+        self._current: RefreshTiming | None = None
+
+    @property
+    def active(self) -> bool:
+        """Return whether a capture is running.
+
+        Returns:
+            True if not all requested refreshes have been captured yet.
+
+        """
+        return len(self.refreshes) < self.requested
+
+    def start(self, refreshes: int) -> None:
+        """Start capturing the next refreshes, dropping a previous capture.
+
+        Args:
+            refreshes: The number of refreshes to capture.
+
+        """
+        if self._current is not None and self._profile is not None:
+            self._profile.disable()
+        self.requested = refreshes
+        self.refreshes = []
+        self.hot_functions = []
+        self.note = None
+        self._profile = cProfile.Profile()
+        self._current = None
+
+    def begin(self) -> RefreshHandle | None:
+        """Start profiling a refresh, if a capture is running.
+
+        Returns:
+            The handle to finish profiling the refresh with, or None if no
+            capture is running or another refresh is being profiled.
+
+        """
+        if not self.active or self._current is not None:
+            return None
+        self._current = RefreshTiming()
+        if self._profile is not None:
+            try:
+                self._profile.enable()
+            except ValueError:
+                # Only a single profiler can be active at a time.
+                self._profile = None
+                self.note = "Another profiler was active, functions not captured"
+        return RefreshHandle(
+            timing=self._current,
+            token=_REFRESH.set(self._current),
+            started=perf_counter(),
+        )
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase of the refresh being profiled.
+
+        Args:
+            name: The name of the phase.
+
+        Yields:
+            Nothing, the phase is timed until the context is left.
+
+        """
+        timing = self._timing()
+        if timing is None:
+            yield
+            return
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            timing.wall[name] = timing.wall.get(name, 0) + perf_counter() - started
+
+    @contextmanager
+    def decode(self) -> Iterator[None]:
+        """Time decoding a reply for the refresh being profiled.
+
+        Only use this around synchronous code, time spent awaiting would
+        include whatever else the event loop runs meanwhile.
+
+        Yields:
+            Nothing, decoding is timed until the context is left.
+
+        """
+        timing = self._timing()
+        if timing is None:
+            yield
+            return
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            timing.decode += perf_counter() - started
+
+    def _timing(self) -> RefreshTiming | None:
+        """Return the timing of the refresh being profiled.
+
+        Returns:
+            The timing, or None outside of the refresh being captured.
+
+        """
+        timing = _REFRESH.get()
+        return timing if timing is not None and timing is self._current else None
+
+    def end(self, handle: RefreshHandle | None, writes: int) -> None:
+        """Finish profiling a refresh.
+
+        Args:
+            handle: The handle returned by `begin` for the refresh.
+            writes: The number of entity states written by the refresh.
+
+        """
+        if handle is None:
+            return
+        _REFRESH.reset(handle.token)
+        timing = handle.timing
+        if timing is not self._current:
+            # A new capture was started during the refresh.
+            return
+        timing.total = perf_counter() - handle.started
+        timing.writes = writes
+        self._current = None
+        self.refreshes.append(timing)
+        if self._profile is None:
+            return
+        self._profile.disable()
+        if not self.active:
+            self.hot_functions = _hot_functions(self._profile)
+            self._profile = None
+
+    def as_dict(self) -> dict[str, Any] | None:
+        """Return the capture for the diagnostics.
+
+        Returns:
+            The timing of every captured refresh, the mean time per phase
+            and the functions with the most own time, or None if no
+            capture was started.
+
+        """
+        if not self.requested:
+            return None
+        refreshes = [timing.as_dict() for timing in self.refreshes]
+        mean: dict[str, float] = {}
+        for refresh in refreshes:
+            for phase, value in refresh["phases"].items():
+                mean[phase] = mean.get(phase, 0.0) + value / len(refreshes)
+        return {
+            "status": "running" if self.active else "complete",
+            "requested": self.requested,
+            "captured": len(refreshes),
+            "note": self.note,
+            "mean": {phase: round(value, 3) for phase, value in mean.items()},
+            "refreshes": refreshes,
+            "hot_functions": self.hot_functions,
+        }
+
+
+def _hot_functions(profile: cProfile.Profile) -> list[dict[str, Any]]:
+    """Return the functions with the most own time of a profile.
+
+    Args:
+        profile: The profile of the captured refreshes.
+
+    Returns:
+        The location, calls, own and cumulative time of each function.
+
+    """
+    stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [
+        {
+            "function": name
+            if path == "~"
+            else f"{'/'.join(PurePath(path).parts[-2:])}:{line}({name})",
+            "calls": calls,
+            "own_ms": round(own * 1000, 3),
+            "cumulative_ms": round(cumulative * 1000, 3),
+        }
+        for (path, line, name), (_, calls, own, cumulative, _) in ranked[
+            :PROFILE_TOP_FUNCTIONS
+        ]
+    ]
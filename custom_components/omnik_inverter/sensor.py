@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import dataclasses
+from datetime import timedelta
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.components.sensor import (
@@ -25,7 +27,11 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.util import slugify
 
 from .const import SERVICE_DEVICE, SERVICE_INVERTER
-from .models import OmnikInverterEntity, RangedSensorEntityDescription
+from .models import (
+    OmnikInverterEntity,
+    OmnikInverterSensorEntityDescription,
+    RangedSensorEntityDescription,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -34,8 +40,12 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from . import OmnikInverterConfigEntry
+    from .aggregation import SampleAggregator, WindowStatistics
     from .coordinator import OmnikInverterDataUpdateCoordinator
 
+# Filtered sensors are written at least this often, even when steady.
+FILTER_MAX_AGE = timedelta(minutes=15)
+
 SENSORS: dict[Literal["inverter", "device"], tuple[SensorEntityDescription, ...]] = {
     SERVICE_DEVICE: (
         SensorEntityDescription(
@@ -53,13 +63,16 @@ SENSORS: dict[Literal["inverter", "device"], tuple[SensorEntityDescription, ...]
         ),
     ),
     SERVICE_INVERTER: (
-        SensorEntityDescription(
+        OmnikInverterSensorEntityDescription(  # pylint: disable=unexpected-keyword-arg
             key="solar_current_power",
             name="Current Power Production",
             icon="mdi:weather-sunny",
             native_unit_of_measurement=UnitOfPower.WATT,
             device_class=SensorDeviceClass.POWER,
             state_class=SensorStateClass.MEASUREMENT,
+            deadband=2,
+            deadband_relative=0.005,
+            max_age=FILTER_MAX_AGE,
         ),
         SensorEntityDescription(
             key="solar_energy_today",
@@ -68,6 +81,16 @@ SENSORS: dict[Literal["inverter", "device"], tuple[SensorEntityDescription, ...]
             device_class=SensorDeviceClass.ENERGY,
             state_class=SensorStateClass.TOTAL_INCREASING,
         ),
+        OmnikInverterSensorEntityDescription(  # pylint: disable=unexpected-keyword-arg
+            key="solar_energy_today_integrated",
+            name="Solar Production - Today (High Resolution)",
+            entity_registry_enabled_default=False,
+            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+            device_class=SensorDeviceClass.ENERGY,
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            suggested_display_precision=3,
+            value_fn=lambda coordinator: round(coordinator.energy.energy_today, 4),
+        ),
         SensorEntityDescription(
             key="solar_energy_total",
             name="Solar Production - Total",
@@ -97,6 +120,18 @@ SENSORS: dict[Literal["inverter", "device"], tuple[SensorEntityDescription, ...]
             name="Alarm Code",
             icon="mdi:alert",
         ),
+        OmnikInverterSensorEntityDescription(  # pylint: disable=unexpected-keyword-arg
+            key="dc_strings_underperforming",
+            name="DC Strings - Underperforming",
+            entity_registry_enabled_default=False,
+            icon="mdi:solar-panel",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            value_fn=lambda coordinator: coordinator.monitoring.strings.underperforming,
+            attributes_fn=lambda coordinator: {
+                f"string_{index + 1}": baseline.as_dict()
+                for index, baseline in coordinator.monitoring.strings.tracked
+            },
+        ),
         RangedSensorEntityDescription(  # pylint: disable=unexpected-keyword-arg
             key="dc_input_{}_voltage",
             size=range(3),
@@ -129,6 +164,8 @@ SENSORS: dict[Literal["inverter", "device"], tuple[SensorEntityDescription, ...]
             native_unit_of_measurement=UnitOfElectricPotential.VOLT,
             device_class=SensorDeviceClass.VOLTAGE,
             state_class=SensorStateClass.MEASUREMENT,
+            deadband=0.5,
+            max_age=FILTER_MAX_AGE,
         ),
         RangedSensorEntityDescription(  # pylint: disable=unexpected-keyword-arg
             key="ac_output_{}_current",
@@ -162,6 +199,8 @@ SENSORS: dict[Literal["inverter", "device"], tuple[SensorEntityDescription, ...]
             native_unit_of_measurement=UnitOfFrequency.HERTZ,
             device_class=SensorDeviceClass.FREQUENCY,
             state_class=SensorStateClass.MEASUREMENT,
+            deadband=0.05,
+            max_age=FILTER_MAX_AGE,
         ),
     ),
 }
@@ -181,7 +220,6 @@ async def async_setup_entry(
 
     """
     coordinator = entry.runtime_data
-    options = entry.options
 
     def create_sensor_entities(
         description: SensorEntityDescription, service: str
@@ -197,7 +235,6 @@ async def async_setup_entry(
                     name=entry.title,
                     description=description,
                     service=service,
-                    options=options,
                 )
         else:
             yield OmnikInverterSensor(
@@ -205,7 +242,6 @@ async def async_setup_entry(
                 name=entry.title,
                 description=description,
                 service=service,
-                options=options,
             )
 
     entities = (
@@ -222,7 +258,8 @@ class OmnikInverterSensor(OmnikInverterEntity, SensorEntity):
     """Defines an Omnik Inverter Sensor."""
 
     entity_description: SensorEntityDescription
-    _options: dict[str, Any]
+    _written_value: Any | None = None
+    _written_at: float = 0.0
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -230,7 +267,6 @@ class OmnikInverterSensor(OmnikInverterEntity, SensorEntity):
         name: str,
         description: SensorEntityDescription,
         service: str,
-        options: dict[str, Any],
     ) -> None:
         """Initialise the entity.
 
@@ -239,13 +275,11 @@ class OmnikInverterSensor(OmnikInverterEntity, SensorEntity):
             name: The identifier for this entity.
             description: The entity description for the sensor.
             service: The service to create the sensor for.
-            options: The options provided by the user.
 
         """
         super().__init__(coordinator=coordinator, name=name, service=service)
 
         self.entity_description = description
-        self._options = options
 
         self._attr_unique_id = slugify(
             f"{self.entry_id}_{service}_{self.entity_description.key}"
@@ -260,6 +294,12 @@ class OmnikInverterSensor(OmnikInverterEntity, SensorEntity):
             The current state value of the sensor.
 
         """
+        if (
+            isinstance(self.entity_description, OmnikInverterSensorEntityDescription)
+            and self.entity_description.value_fn is not None
+        ):
+            return self.entity_description.value_fn(self.coordinator)
+
         value = getattr(
             self.coordinator.data[self.service], self.entity_description.key
         )
@@ -269,6 +309,62 @@ class OmnikInverterSensor(OmnikInverterEntity, SensorEntity):
 
         return value
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the window statistics of an aggregated sensor.
+
+        Returns:
+            The attributes from the `attributes_fn` of the description, or
+            the minimum, maximum and sample count of the published window,
+            or None if the sensor is not aggregated.
+
+        """
+        if (
+            isinstance(self.entity_description, OmnikInverterSensorEntityDescription)
+            and self.entity_description.attributes_fn is not None
+        ):
+            return self.entity_description.attributes_fn(self.coordinator)
+        if self.coordinator.aggregator is None:
+            return None
+        statistics = self._window_statistics(self.coordinator.aggregator)
+        if statistics is None:
+            return None
+        return statistics.as_dict()
+
+    def _window_statistics(
+        self, aggregator: SampleAggregator
+    ) -> WindowStatistics | None:
+        """Return the statistics of the published window for this sensor.
+
+        Args:
+            aggregator: The aggregator of the coordinator.
+
+        Returns:
+            The window statistics, or None if the sensor is not aggregated.
+
+        """
+        return aggregator.statistics(self.entity_description.key)
+
+    def _should_write_state(self) -> bool:
+        """Return whether the refreshed value passes the write filter.
+
+        Returns:
+            True if the value should be written to the state machine.
+
+        """
+        value = self.native_value
+        now = monotonic()
+        if isinstance(
+            self.entity_description, OmnikInverterSensorEntityDescription
+        ) and not self.entity_description.should_write(
+            self._written_value, value, timedelta(seconds=now - self._written_at)
+        ):
+            return False
+
+        self._written_value = value
+        self._written_at = now
+        return True
+
 
 class OmnikInverterRangedSensor(OmnikInverterSensor):
     """Defines an Omnik Inverter Sensor."""
@@ -276,14 +372,13 @@ class OmnikInverterRangedSensor(OmnikInverterSensor):
     _index: int
     _data_key: str
 
-    def __init__(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         coordinator: OmnikInverterDataUpdateCoordinator,
         index: int,
         name: str,
         description: RangedSensorEntityDescription,
         service: str,
-        options: dict[str, Any],
     ) -> None:
         """Initialise the entity.
 
@@ -293,7 +388,6 @@ class OmnikInverterRangedSensor(OmnikInverterSensor):
             name: The identifier for this entity.
             description: The entity description for the sensor.
             service: The service to create the sensor for.
-            options: The options provided by the user.
 
         """
         self._index = index
@@ -312,7 +406,6 @@ class OmnikInverterRangedSensor(OmnikInverterSensor):
             name=name,
             description=description,
             service=service,
-            options=options,
         )
 
     @property
@@ -329,3 +422,17 @@ class OmnikInverterRangedSensor(OmnikInverterSensor):
             return value[self._index]
 
         return None
+
+    def _window_statistics(
+        self, aggregator: SampleAggregator
+    ) -> WindowStatistics | None:
+        """Return the statistics of the published window for this sensor.
+
+        Args:
+            aggregator: The aggregator of the coordinator.
+
+        Returns:
+            The window statistics, or None if the sensor is not aggregated.
+
+        """
+        return aggregator.statistics(self._data_key, self._index)
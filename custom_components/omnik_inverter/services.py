@@ -0,0 +1,215 @@
+"""Services of the Omnik Inverter integration."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .const import DATA_REFRESH_TIMES, DOMAIN, REFRESH_MIN_SPACING
+from .profiling import PROFILE_DEFAULT_REFRESHES, PROFILE_MAX_REFRESHES
+
+if TYPE_CHECKING:
+    from . import OmnikInverterConfigEntry
+
+SERVICE_REFRESH = "refresh"
+SERVICE_PROFILE = "profile"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_REFRESHES = "refreshes"
+
+RESULT_REFRESHED = "refreshed"
+RESULT_FAILED = "failed"
+RESULT_RATE_LIMITED = "rate_limited"
+RESULT_SCHEDULED = "scheduled"
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+PROFILE_SCHEMA = REFRESH_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_REFRESHES, default=PROFILE_DEFAULT_REFRESHES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_REFRESHES)
+        ),
+    }
+)
+
+
+async def _async_get_entries(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[OmnikInverterConfigEntry]:
+    """Return the loaded entries targeted by a service call.
+
+    Args:
+        hass: The HomeAssistant instance.
+        call: The service call.
+
+    Returns:
+        The targeted entries, or all loaded entries without a target.
+
+    Raises:
+        ServiceValidationError: A targeted entry is not a loaded Omnik
+            Inverter entry.
+
+    """
+    requested = set(call.data.get(ATTR_CONFIG_ENTRY_ID, []))
+    entry_ids = set(requested)
+    if any(key in call.data for key in cv.TARGET_SERVICE_FIELDS):
+        entry_ids |= await async_extract_config_entry_ids(hass, call)
+
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+        and (not entry_ids or entry.entry_id in entry_ids)
+    ]
+    if requested - {entry.entry_id for entry in entries}:
+        msg = "Not all targeted Omnik Inverters are loaded"
+        raise ServiceValidationError(msg)
+    return entries
+
+
+async def _async_refresh_entry(
+    entry: OmnikInverterConfigEntry, started: float
+) -> dict[str, Any]:
+    """Refresh a single entry.
+
+    Args:
+        entry: The entry to refresh.
+        started: The time the refresh of the host started.
+
+    Returns:
+        The result and latency of the refresh.
+
+    """
+    coordinator = entry.runtime_data
+    refreshes = coordinator.refreshes
+    await coordinator.async_request_refresh()
+    latency = round(monotonic() - started, 3)
+
+    if coordinator.refreshes == refreshes:
+        # The debouncer is cooling down and refreshes later.
+        return {"result": RESULT_SCHEDULED}
+    if not coordinator.last_update_success:
+        return {
+            "result": RESULT_FAILED,
+            "latency": latency,
+            "error": str(coordinator.last_exception),
+        }
+    return {"result": RESULT_REFRESHED, "latency": latency}
+
+
+async def _async_refresh_host(
+    hass: HomeAssistant, host: str, entries: list[OmnikInverterConfigEntry]
+) -> list[dict[str, Any]]:
+    """Refresh the entries of a host, unless it was refreshed too recently.
+
+    The entries of a host are refreshed together, they share the requests
+    to the logger.
+
+    Args:
+        hass: The HomeAssistant instance.
+        host: The normalized host of the entries.
+        entries: The entries to refresh.
+
+    Returns:
+        The result of the refresh per entry.
+
+    """
+    refresh_times: dict[str, float] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_REFRESH_TIMES, {}
+    )
+    started = monotonic()
+
+    elapsed = started - refresh_times.get(host, -REFRESH_MIN_SPACING)
+    if elapsed < REFRESH_MIN_SPACING:
+        retry_after = round(REFRESH_MIN_SPACING - elapsed, 1)
+        return [
+            {"result": RESULT_RATE_LIMITED, "retry_after": retry_after} for _ in entries
+        ]
+    refresh_times[host] = started
+
+    return await asyncio.gather(
+        *(_async_refresh_entry(entry, started) for entry in entries)
+    )
+
+
+async def _async_refresh(call: ServiceCall) -> ServiceResponse:
+    """Handle the refresh service call.
+
+    Every host is refreshed at most once per call, different hosts are
+    refreshed concurrently.
+
+    Args:
+        call: The service call.
+
+    Returns:
+        The result of the refresh per entry id.
+
+    """
+    hosts: dict[str, list[OmnikInverterConfigEntry]] = {}
+    for entry in await _async_get_entries(call.hass, call):
+        hosts.setdefault(entry.data[CONF_HOST].strip().lower(), []).append(entry)
+
+    results = await asyncio.gather(
+        *(
+            _async_refresh_host(call.hass, host, entries)
+            for host, entries in hosts.items()
+        )
+    )
+    return {
+        "entries": {
+            entry.entry_id: result
+            for entries, host_results in zip(hosts.values(), results, strict=True)
+            for entry, result in zip(entries, host_results, strict=True)
+        }
+    }
+
+
+async def _async_profile(call: ServiceCall) -> None:
+    """Handle the profile service call.
+
+    The next refreshes of the targeted entries are profiled, the capture
+    is added to the diagnostics of each entry.
+
+    Args:
+        call: The service call.
+
+    """
+    for entry in await _async_get_entries(call.hass, call):
+        entry.runtime_data.monitoring.profiler.start(call.data[ATTR_REFRESHES])
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the Omnik Inverter integration.
+
+    Args:
+        hass: The HomeAssistant instance.
+
+    """
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        _async_refresh,
+        schema=REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA
+    )
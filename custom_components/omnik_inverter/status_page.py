@@ -0,0 +1,378 @@
+"""Streaming extraction of values from the Omnik Inverter status pages."""
+
+from __future__ import annotations
+
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING
+
+from aiohttp import BasicAuth, ClientError
+
+from omnikinverter import Device, Inverter
+from omnikinverter.exceptions import (
+    OmnikInverterAuthError,
+    OmnikInverterConnectionError,
+    OmnikInverterError,
+    OmnikInverterWrongSourceError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from aiohttp import ClientResponse, ClientSession
+
+CHUNK_SIZE = 1024
+# Characters kept between chunks, so keys split over two chunks are found.
+KEY_TAIL_SIZE = 64
+# Values longer than this are not values the integration is looking for.
+MAX_VALUE_SIZE = 4096
+CONTENT_TYPES = ("application/json", "application/x-javascript", "text/html")
+
+STATUS_PAGES = {
+    "javascript": "js/status.js",
+    "html": "status.html",
+}
+
+# Each group lists alternative keys, a page is complete once every group
+# has been found.
+INVERTER_KEYS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "javascript": (("webData", "myDeviceArray[0]"),),
+    "html": (
+        ("webdata_sn",),
+        ("webdata_pv_type",),
+        ("webdata_msvn",),
+        ("webdata_ssvn",),
+        ("webdata_alarm",),
+        ("webdata_rate_p",),
+        ("webdata_now_p",),
+        ("webdata_today_e",),
+        ("webdata_total_e",),
+    ),
+}
+DEVICE_KEYS: dict[str, tuple[tuple[str, ...], ...]] = {
+    "javascript": (("m2mRssi",), ("version",), ("wanIp",)),
+    "html": (("cover_sta_rssi",), ("cover_ver",), ("cover_sta_ip",)),
+}
+
+
+def _is_key_character(character: str) -> bool:
+    """Return whether a character can be part of a key.
+
+    Args:
+        character: The character to check.
+
+    Returns:
+        True for characters of identifiers and array indexes.
+
+    """
+    return character.isalnum() or character in "_[]"
+
+
+class StatusPageExtractor:
+    """Extract `key="value";` assignments from a page fed in chunks.
+
+    Only a short tail of the page is kept between chunks, and extraction
+    stops as soon as all requested keys were found.
+    """
+
+    def __init__(self, groups: Iterable[tuple[str, ...]]) -> None:
+        """Initialise the extractor.
+
+        Args:
+            groups: Groups of alternative keys, one key of every group
+                has to be found.
+
+        """
+        self.values: dict[str, str] = {}
+        self._groups = [set(group) for group in groups]
+        self._pending = set().union(*self._groups)
+        self._buffer = ""
+
+    @property
+    def done(self) -> bool:
+        """Return whether a key of every group has been found.
+
+        Returns:
+            True if extraction is complete.
+
+        """
+        return not self._groups
+
+    def feed(self, chunk: str) -> bool:
+        """Scan the next chunk of the page.
+
+        Args:
+            chunk: The next part of the page.
+
+        Returns:
+            True once a key of every group has been found.
+
+        """
+        buffer = self._buffer + chunk
+        position = 0
+        keep = max(len(buffer) - KEY_TAIL_SIZE, 0)
+
+        while not self.done:
+            equals = buffer.find("=", position)
+            if equals == -1:
+                break
+            position = equals + 1
+
+            end = equals
+            while end > 0 and buffer[end - 1] == " ":
+                end -= 1
+            start = end
+            while start > 0 and _is_key_character(buffer[start - 1]):
+                start -= 1
+            key = buffer[start:end]
+            if key not in self._pending:
+                continue
+
+            quote = position
+            while quote < len(buffer) and buffer[quote] == " ":
+                quote += 1
+            if quote < len(buffer) and buffer[quote] != '"':
+                continue
+            close = buffer.find('"', quote + 1)
+            if quote == len(buffer) or close == -1:
+                # The value continues in the next chunk.
+                if len(buffer) - start <= MAX_VALUE_SIZE:
+                    keep = start
+                    break
+                continue
+
+            self._found(key, buffer[quote + 1 : close])
+            position = close + 1
+            keep = max(keep, position)
+
+        self._buffer = "" if self.done else buffer[keep:]
+        return self.done
+
+    def _found(self, key: str, value: str) -> None:
+        """Store a found value and complete the groups it belongs to.
+
+        Args:
+            key: The found key.
+            value: The value of the key.
+
+        """
+        self.values[key] = value
+        for group in [group for group in self._groups if key in group]:
+            self._groups.remove(group)
+            self._pending -= group
+
+
+def _javascript_inverter(values: dict[str, str]) -> Inverter:
+    """Create an Inverter object from the values of a javascript page.
+
+    Args:
+        values: The extracted values.
+
+    Returns:
+        An Inverter object.
+
+    """
+    fields = values.get("webData", values.get("myDeviceArray[0]", "")).split(",")
+    fields.extend("" for _ in range(9 - len(fields)))
+
+    def text(position: int) -> str | None:
+        return fields[position].replace(" ", "") or None
+
+    def number(position: int) -> int | None:
+        return int(fields[position].replace(" ", "")) if fields[position] else None
+
+    def energy(position: int, divider: int) -> float | None:
+        return float(fields[position]) / divider if fields[position] else None
+
+    return Inverter(
+        serial_number=text(0),
+        model=text(3),
+        firmware=text(1),
+        firmware_slave=text(2),
+        alarm_code=text(8),
+        solar_rated_power=number(4),
+        solar_current_power=number(5),
+        solar_energy_today=energy(6, 100),
+        solar_energy_total=energy(7, 10),
+    )
+
+
+def _html_inverter(values: dict[str, str]) -> Inverter:
+    """Create an Inverter object from the values of a HTML page.
+
+    Args:
+        values: The extracted values.
+
+    Returns:
+        An Inverter object.
+
+    """
+
+    def text(key: str) -> str | None:
+        return values[key].replace(" ", "") or None
+
+    def number(key: str) -> int | None:
+        value = text(key)
+        return int(value) if value else None
+
+    def energy(key: str) -> float | None:
+        value = text(key)
+        return float(value) if value else None
+
+    return Inverter(
+        serial_number=text("webdata_sn"),
+        model=text("webdata_pv_type"),
+        firmware=text("webdata_msvn"),
+        firmware_slave=text("webdata_ssvn"),
+        alarm_code=text("webdata_alarm"),
+        solar_rated_power=number("webdata_rate_p"),
+        solar_current_power=number("webdata_now_p"),
+        solar_energy_today=energy("webdata_today_e"),
+        solar_energy_total=energy("webdata_total_e"),
+    )
+
+
+def _device(source_type: str, values: dict[str, str]) -> Device:
+    """Create a Device object from the values of a status page.
+
+    Args:
+        source_type: The source type of the page.
+        values: The extracted values.
+
+    Returns:
+        A Device object.
+
+    """
+    rssi, firmware, ip_address = (
+        values[key].replace(" ", "").replace("%", "") or None
+        for (key,) in DEVICE_KEYS[source_type]
+    )
+    return Device(
+        signal_quality=int(rssi) if rssi else None,
+        firmware=firmware,
+        ip_address=ip_address,
+    )
+
+
+def _decode(
+    source_type: str, values: dict[str, str], *, include_device: bool
+) -> tuple[Inverter, Device | None]:
+    """Create the Inverter and Device objects from the values of a status page.
+
+    Args:
+        source_type: The source type of the page.
+        values: The extracted values.
+        include_device: Whether to create the Device object as well.
+
+    Returns:
+        The inverter data, and the device data if requested.
+
+    """
+    inverter = (
+        _javascript_inverter(values)
+        if source_type == "javascript"
+        else _html_inverter(values)
+    )
+    return inverter, _device(source_type, values) if include_device else None
+
+
+async def _async_read(
+    response: ClientResponse,
+    extractor: StatusPageExtractor,
+    on_receive: Callable[[int], None] | None,
+    decode_timer: Callable[[], AbstractContextManager[object]],
+) -> None:
+    """Feed a status page to the extractor while it is received.
+
+    Args:
+        response: The response with the status page.
+        extractor: The extractor to feed the page to.
+        on_receive: Called with the size of every received chunk.
+        decode_timer: Context manager factory wrapped around every
+            synchronous section that decodes the page.
+
+    Raises:
+        OmnikInverterError: Received an unexpected response from the Omnik
+            Inverter.
+
+    """
+    content_type = response.headers.get("Content-Type", "")
+    if not any(item in content_type for item in CONTENT_TYPES):
+        msg = "Unexpected response from the Omnik Inverter device"
+        raise OmnikInverterError(msg, {"Content-Type": content_type})
+
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        if on_receive is not None:
+            on_receive(len(chunk))
+        with decode_timer():
+            done = extractor.feed(chunk.decode("ascii", "ignore"))
+        if done:
+            break
+
+
+async def async_request_status_page(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+    session: ClientSession,
+    host: str,
+    source_type: str,
+    *,
+    include_device: bool,
+    username: str | None = None,
+    password: str | None = None,
+    on_receive: Callable[[int], None] | None = None,
+    decode_timer: Callable[[], AbstractContextManager[object]] = nullcontext,
+) -> tuple[Inverter, Device | None]:
+    """Request a status page and extract the inverter and device data.
+
+    The page is scanned while it is received, the request stops as soon
+    as all values were found.
+
+    Args:
+        session: The client session to use.
+        host: The host name or IP address of the logger.
+        source_type: The source type, `javascript` or `html`.
+        include_device: Whether to extract the device data as well.
+        username: The username for the HTML status page.
+        password: The password for the HTML status page.
+        on_receive: Called with the size of every received chunk.
+        decode_timer: Context manager factory wrapped around every
+            synchronous section that decodes the page.
+
+    Returns:
+        The inverter data, and the device data if requested.
+
+    Raises:
+        OmnikInverterAuthError: The credentials of the HTML page are missing.
+        OmnikInverterConnectionError: An error occurred while communicating
+            with the Omnik Inverter.
+        OmnikInverterError: Received an unexpected response from the Omnik
+            Inverter.
+        OmnikInverterWrongSourceError: The page does not contain the data.
+
+    """
+    if source_type == "html" and (username is None or password is None):
+        msg = "A username and/or password is missing from the request"
+        raise OmnikInverterAuthError(msg)
+
+    groups = INVERTER_KEYS[source_type]
+    if include_device:
+        groups += DEVICE_KEYS[source_type]
+    extractor = StatusPageExtractor(groups)
+
+    auth = BasicAuth(username, password) if username and password else None
+    try:
+        async with session.get(
+            f"http://{host}/{STATUS_PAGES[source_type]}",
+            auth=auth,
+            headers={"Accept": "text/html,application/xhtml+xml,application/xml"},
+            raise_for_status=True,
+        ) as response:
+            await _async_read(response, extractor, on_receive, decode_timer)
+    except ClientError as exception:
+        msg = "Error occurred while communicating with Omnik Inverter device"
+        raise OmnikInverterConnectionError(msg) from exception
+
+    if not extractor.done:
+        msg = f"Your inverter has no data source from a {source_type} file."
+        raise OmnikInverterWrongSourceError(msg)
+
+    with decode_timer():
+        return _decode(source_type, extractor.values, include_device=include_device)
@@ -0,0 +1,290 @@
+"""Fast decoder for the raw TCP protocol of the Omnik Inverter."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, cast
+
+from omnikinverter import Inverter
+from omnikinverter.exceptions import (
+    OmnikInverterConnectionError,
+    OmnikInverterPacketInvalidError,
+)
+from omnikinverter.tcp import create_information_request
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Callable
+
+TCP_PORT = 8899
+# Upper bound of a reply, an information reply with firmware is ~180 bytes.
+MAX_REPLY_SIZE = 1024
+
+MESSAGE_START = 0x68
+MESSAGE_END = 0x16
+MESSAGE_RECV_SEP = 0x41
+MESSAGE_TYPE_INFORMATION_REPLY = 0xB0
+MESSAGE_TYPE_STRING = 0xF0
+MESSAGE_PADDING = 0xFF
+# Length, separator, message type, serial number twice and the checksum.
+MESSAGE_HEADER_SIZE = 3 + 2 * 4 + 1
+
+UINT16_MAX = 65535
+TEMPERATURE_OFFLINE = 65326
+
+_SERIAL_NUMBERS = struct.Struct("<II")
+# Padding, serial number, temperature, DC input voltage and current, AC output
+# current and voltage, AC output frequency and power pairs, energy today, energy
+# total, hours total, inverter active, padding, unknown and padding.
+_INFORMATION = struct.Struct(">3x16sH3H3H3H3H6HHIIH4xH10x")
+_FIRMWARE = struct.Struct(">16s4x16s4x")
+
+
+def _decode_string(value: bytes) -> str:
+    """Decode a NUL terminated string field.
+
+    Args:
+        value: The raw field.
+
+    Returns:
+        The decoded string.
+
+    """
+    return value.split(b"\0", 1)[0].decode("utf-8", "replace")
+
+
+def _scale(values: tuple[int, ...], factor: float) -> list[float]:
+    """Scale raw values, mapping unset values to None.
+
+    Inverter annotates these fields as `list[float]`, but the library maps
+    unset values to None as well, so the values are cast to match.
+
+    Args:
+        values: The raw values.
+        factor: The unit of the raw values.
+
+    Returns:
+        The scaled values.
+
+    """
+    return cast(
+        "list[float]",
+        [None if value == UINT16_MAX else value * factor for value in values],
+    )
+
+
+def _decode_information(payload: memoryview) -> Inverter:
+    """Decode the payload of an information reply.
+
+    Args:
+        payload: The payload of the message.
+
+    Returns:
+        The decoded inverter data.
+
+    Raises:
+        OmnikInverterPacketInvalidError: The payload is too short.
+
+    """
+    if len(payload) < _INFORMATION.size:
+        msg = f"Information reply of {len(payload)} bytes is too short"
+        raise OmnikInverterPacketInvalidError(msg)
+
+    fields = _INFORMATION.unpack_from(payload)
+    ac_output = fields[14:20]
+    powers = [None if value == UINT16_MAX else value for value in ac_output[1::2]]
+
+    firmware = firmware_slave = None
+    if len(payload) >= _INFORMATION.size + _FIRMWARE.size:
+        raw_firmware, raw_firmware_slave = _FIRMWARE.unpack_from(
+            payload, _INFORMATION.size
+        )
+        firmware = _decode_string(raw_firmware)
+        firmware_slave = _decode_string(raw_firmware_slave)
+
+    temperature = fields[1]
+    return Inverter(
+        serial_number=_decode_string(fields[0]),
+        model=None,
+        solar_rated_power=None,
+        solar_current_power=sum(power for power in powers if power is not None),
+        solar_energy_today=fields[20] * 0.01,
+        solar_energy_total=fields[21] * 0.1,
+        firmware=firmware,
+        firmware_slave=firmware_slave,
+        inverter_active={0: False, 1: True}.get(fields[23]),
+        solar_hours_total=fields[22],
+        temperature=None if temperature == TEMPERATURE_OFFLINE else temperature * 0.1,
+        dc_input_voltage=_scale(fields[2:5], 0.1),
+        dc_input_current=_scale(fields[5:8], 0.1),
+        ac_output_current=_scale(fields[8:11], 0.1),
+        ac_output_voltage=_scale(fields[11:14], 0.1),
+        ac_output_frequency=_scale(ac_output[0::2], 0.01),
+        ac_output_power=cast("list[float]", powers),
+    )
+
+
+def _validate_message(view: memoryview, offset: int) -> int:
+    """Validate the framing of the message starting at an offset.
+
+    Args:
+        view: The raw reply.
+        offset: The offset of the start byte of the message.
+
+    Returns:
+        The offset of the checksum of the message.
+
+    Raises:
+        OmnikInverterPacketInvalidError: The message is malformed or truncated.
+
+    """
+    size = len(view)
+    if view[offset] != MESSAGE_START:
+        msg = f"Invalid start byte: {view[offset]}"
+        raise OmnikInverterPacketInvalidError(msg)
+    if offset + MESSAGE_HEADER_SIZE >= size:
+        msg = "Truncated message header in TCP reply"
+        raise OmnikInverterPacketInvalidError(msg)
+
+    checksum_index = offset + MESSAGE_HEADER_SIZE + view[offset + 1]
+    if checksum_index + 1 >= size:
+        msg = "Truncated message in TCP reply"
+        raise OmnikInverterPacketInvalidError(msg)
+    if view[checksum_index + 1] != MESSAGE_END:
+        msg = "Invalid end byte"
+        raise OmnikInverterPacketInvalidError(msg)
+    checksum = sum(view[offset + 1 : checksum_index]) & 0xFF
+    if checksum != view[checksum_index]:
+        msg = (
+            f"Checksum mismatch (calculated `{checksum}` got `{view[checksum_index]}`)"
+        )
+        raise OmnikInverterPacketInvalidError(msg)
+    if view[offset + 2] != MESSAGE_RECV_SEP:
+        msg = "Invalid receiver separator"
+        raise OmnikInverterPacketInvalidError(msg)
+
+    serial0, serial1 = _SERIAL_NUMBERS.unpack_from(view, offset + 4)
+    if serial0 != serial1:
+        msg = f"Serial number mismatch in reply {serial0} != {serial1}"
+        raise OmnikInverterPacketInvalidError(msg)
+    return checksum_index
+
+
+def decode_reply(data: Buffer) -> Inverter:
+    """Decode a raw TCP reply of the Omnik Inverter.
+
+    The reply is read in place through a memoryview, the fields are unpacked
+    straight from their offsets without copying the messages.
+
+    Args:
+        data: The raw reply, which may contain multiple messages.
+
+    Returns:
+        The inverter data from the information reply.
+
+    Raises:
+        OmnikInverterPacketInvalidError: The reply is malformed, truncated or
+            does not contain an information reply.
+
+    """
+    view = memoryview(data)
+    offset = 0
+    inverter: Inverter | None = None
+
+    # Some loggers pad the reply with 0xFF bytes.
+    while offset < len(view) and view[offset] != MESSAGE_PADDING:
+        checksum_index = _validate_message(view, offset)
+        message_type = view[offset + 3]
+        payload = view[offset + MESSAGE_HEADER_SIZE : checksum_index]
+        if message_type == MESSAGE_TYPE_INFORMATION_REPLY:
+            inverter = _decode_information(payload)
+        elif message_type == MESSAGE_TYPE_STRING:
+            LOGGER.debug("Omnik sent text message `%s`", bytes(payload))
+        else:
+            msg = f"Unknown Omnik message type {message_type:02x}"
+            raise OmnikInverterPacketInvalidError(msg)
+
+        offset = checksum_index + 2
+
+    if inverter is None:
+        msg = "None of the messages contained an information reply!"
+        raise OmnikInverterPacketInvalidError(msg)
+    return inverter
+
+
+def _reply_complete(data: bytearray) -> bool:
+    """Return whether a buffered reply ends on a message boundary.
+
+    Args:
+        data: The bytes received so far.
+
+    Returns:
+        True if at least one message was received and the last message
+        is complete.
+
+    """
+    offset = 0
+    size = len(data)
+    while offset < size:
+        if data[offset] == MESSAGE_PADDING:
+            break
+        if offset + 1 >= size:
+            return False
+        offset += data[offset + 1] + MESSAGE_HEADER_SIZE + 2
+    return 0 < offset <= size
+
+
+async def async_request_inverter(
+    host: str,
+    serial_number: int,
+    port: int = TCP_PORT,
+    *,
+    on_receive: Callable[[int], None] | None = None,
+    decode_timer: Callable[[], AbstractContextManager[object]] = nullcontext,
+) -> Inverter:
+    """Request and decode the inverter data over a raw TCP connection.
+
+    Args:
+        host: The host name or IP address of the logger.
+        serial_number: The serial number of the logger.
+        port: The TCP port of the logger.
+        on_receive: Called with the size of every received chunk.
+        decode_timer: Context manager factory wrapped around decoding.
+
+    Returns:
+        The inverter data.
+
+    Raises:
+        OmnikInverterConnectionError: An error occurred while communicating
+            with the Omnik Inverter.
+
+    """
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError as exception:
+        msg = "Failed to open a TCP connection to the Omnik Inverter device"
+        raise OmnikInverterConnectionError(msg) from exception
+
+    try:
+        writer.write(create_information_request(serial_number))
+        await writer.drain()
+
+        data = bytearray()
+        while not _reply_complete(data) and len(data) < MAX_REPLY_SIZE:
+            chunk = await reader.read(MAX_REPLY_SIZE)
+            if not chunk:
+                break
+            if on_receive is not None:
+                on_receive(len(chunk))
+            data += chunk
+    except OSError as exception:
+        msg = "Failed to communicate with the Omnik Inverter device over TCP"
+        raise OmnikInverterConnectionError(msg) from exception
+    finally:
+        writer.close()
+
+    with decode_timer():
+        return decode_reply(data)
@@ -0,0 +1,75 @@
+"""Tests for the Omnik Inverter integration."""
+
+import asyncio
+import json
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.omnik_inverter.const import (
+    CONF_SOURCE_TYPE,
+    CONFIGFLOW_VERSION,
+    DOMAIN,
+)
+
+SERIAL_NUMBER = "NLDN123456789012"
+NETWORK_DELAY = 0.05
+
+
+def status_json(alarm: str = "") -> str:
+    """Return the JSON status page of a logger.
+
+    Args:
+        alarm: The alarm code reported by the inverter.
+
+    Returns:
+        The status page as returned by the logger.
+
+    """
+    return json.dumps(
+        {
+            "g_sn": "1608449224",
+            "g_ver": "VER:H4.01.38Y1.0.09W1.0.08",
+            "ip": "192.168.1.10",
+            "i_sn": SERIAL_NUMBER,
+            "i_modle": "omnik2000tl",
+            "i_ver_m": "V5.04Build230",
+            "i_ver_s": "V4.12Build246",
+            "i_alarm": alarm,
+            "i_pow": "2000",
+            "i_pow_n": "1235",
+            "i_eday": "10.27",
+            "i_eall": "1301.2",
+        }
+    )
+
+
+async def slow_request(*_args: object, **_kwargs: object) -> str:
+    """Return the status page after a network delay.
+
+    Returns:
+        The status page.
+
+    """
+    await asyncio.sleep(NETWORK_DELAY)
+    return status_json()
+
+
+def add_json_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Add a config entry for a logger with the JSON source type.
+
+    Args:
+        hass: The HomeAssistant instance.
+
+    Returns:
+        The added config entry.
+
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=CONFIGFLOW_VERSION,
+        data={CONF_HOST: "192.168.1.10", CONF_SOURCE_TYPE: "json"},
+    )
+    entry.add_to_hass(hass)
+    return entry
@@ -0,0 +1,17 @@
+"""Fixtures for the Omnik Inverter tests."""
+
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: Any,
+) -> None:
+    """Enable the custom integrations in every test.
+
+    Args:
+        enable_custom_integrations: The fixture enabling custom integrations.
+
+    """
@@ -0,0 +1,61 @@
+"""Tests for the aggregation of the Omnik Inverter samples."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.omnik_inverter.aggregation import EnergyIntegrator
+
+MAX_GAP = timedelta(minutes=5)
+RESOLUTION = 0.1
+
+
+def _at(day: int, hour: int, minute: int = 0) -> datetime:
+    """Return a local time in June.
+
+    Args:
+        day: The day of the month.
+        hour: The hour of the day.
+        minute: The minute of the hour.
+
+    Returns:
+        The local time.
+
+    """
+    return datetime(2026, 6, day, hour, minute, tzinfo=dt_util.get_default_time_zone())
+
+
+def test_energy_ignores_yesterday_after_midnight() -> None:
+    """Test the counter ignores the logger counter of yesterday."""
+    integrator = EnergyIntegrator(MAX_GAP, RESOLUTION)
+    integrator.add(_at(1, 21), None)
+    integrator.reconcile(12.3, None)
+    assert integrator.energy_today == pytest.approx(12.3)
+
+    integrator.add(_at(2, 0, 4), None)
+    integrator.reconcile(12.3, None)
+    assert integrator.energy_today == 0.0
+
+    integrator.add(_at(2, 11), 2000)
+    integrator.reconcile(4.0, None)
+    assert integrator.energy_today == pytest.approx(4.0)
+
+
+def test_energy_reanchors_when_the_logger_resets() -> None:
+    """Test the counter follows the logger counter down when it resets."""
+    integrator = EnergyIntegrator(MAX_GAP, RESOLUTION)
+    # Started after midnight, while the logger still reports yesterday.
+    integrator.add(_at(2, 0, 4), None)
+    integrator.reconcile(12.3, None)
+    assert integrator.energy_today == pytest.approx(12.3)
+
+    integrator.add(_at(2, 11), 2000)
+    integrator.reconcile(4.0, None)
+    assert integrator.energy_today == pytest.approx(4.0)
+
+    integrator.add(_at(2, 11, 1), 2000)
+    integrator.reconcile(4.0, None)
+    assert integrator.energy_today == pytest.approx(4.0 + 2000 / 60 / 1000)
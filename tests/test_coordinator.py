@@ -0,0 +1,104 @@
+"""Tests for the Omnik Inverter data update coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.config_entries import current_entry
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.omnik_inverter.aggregation import SampleAggregator
+from custom_components.omnik_inverter.const import EVENT_ALARM, SERVICE_INVERTER
+from custom_components.omnik_inverter.coordinator import (
+    OmnikInverterDataUpdateCoordinator,
+)
+
+from . import SERIAL_NUMBER, add_json_entry, slow_request, status_json
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_alarm_transitions(hass: HomeAssistant) -> None:
+    """Test raising and clearing an alarm fires events on the edges only."""
+    entry = add_json_entry(hass)
+    current_entry.set(entry)
+    coordinator = OmnikInverterDataUpdateCoordinator(hass, entry)
+    events = async_capture_events(hass, EVENT_ALARM)
+
+    with patch(
+        "omnikinverter.OmnikInverter.request", return_value=status_json()
+    ) as request:
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.monitoring.alarm is None
+
+        request.return_value = status_json("Isolation Fault")
+        coordinator.data = await coordinator._async_update_data()
+        coordinator.data = await coordinator._async_update_data()
+        await hass.async_block_till_done()
+
+        assert coordinator.monitoring.alarm is not None
+        assert coordinator.monitoring.alarm.severity == "error"
+        assert len(events) == 1
+        assert events[0].data == {
+            "entry_id": entry.entry_id,
+            "serial_number": SERIAL_NUMBER,
+            "type": "alarm_raised",
+            "code": "Isolation Fault",
+            "severity": "error",
+            "description": "PV isolation resistance too low",
+            "previous_code": None,
+        }
+
+        request.return_value = status_json()
+        coordinator.data = await coordinator._async_update_data()
+        await hass.async_block_till_done()
+
+    assert coordinator.monitoring.alarm is None
+    assert len(events) == 2
+    assert events[1].data["type"] == "alarm_cleared"
+    assert events[1].data["previous_code"] == "Isolation Fault"
+
+
+async def test_shared_fetch_published_once(hass: HomeAssistant) -> None:
+    """Test refreshes sharing a fetch publish the samples only once."""
+    entry = add_json_entry(hass)
+    current_entry.set(entry)
+    coordinator = OmnikInverterDataUpdateCoordinator(hass, entry)
+    coordinator.aggregator = SampleAggregator()
+
+    with patch("omnikinverter.OmnikInverter.request", side_effect=slow_request):
+        await coordinator._async_fetch_data(include_device=False)
+        first = hass.async_create_task(coordinator.async_refresh())
+        await asyncio.sleep(0)
+        second = hass.async_create_task(coordinator.async_refresh())
+        await asyncio.gather(first, second)
+
+    statistics = coordinator.aggregator.statistics("solar_current_power")
+    assert statistics is not None
+    assert statistics.count == 2
+    assert coordinator.data[SERVICE_INVERTER].solar_current_power == 1235
+
+
+async def test_shared_device_data_keeps_update_due(hass: HomeAssistant) -> None:
+    """Test device data a sample did not ask for keeps its update due."""
+    entries = [add_json_entry(hass), add_json_entry(hass)]
+    coordinators = []
+    for entry in entries:
+        current_entry.set(entry)
+        coordinators.append(OmnikInverterDataUpdateCoordinator(hass, entry))
+    refreshed, sampled = coordinators
+
+    with patch("omnikinverter.OmnikInverter.request", side_effect=slow_request):
+        sampled.data = await sampled._async_update_data()
+        assert sampled._device_updated_at is not None
+        sampled._device_updated_at -= sampled.device_update_interval.total_seconds()
+
+        refresh = hass.async_create_task(refreshed.async_refresh())
+        await asyncio.sleep(0)
+        await sampled._async_fetch_data(include_device=False)
+        await refresh
+
+    assert sampled._device_update_due()
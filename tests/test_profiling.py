@@ -0,0 +1,105 @@
+"""Tests for the profiling of the Omnik Inverter refreshes."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from homeassistant.config_entries import current_entry
+
+from custom_components.omnik_inverter.coordinator import (
+    OmnikInverterDataUpdateCoordinator,
+)
+
+from . import NETWORK_DELAY, add_json_entry, slow_request
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.omnik_inverter.coordinator import OmnikInverterData
+
+
+async def test_profile_refresh(hass: HomeAssistant) -> None:
+    """Test a capture splits the request and ignores concurrent samples."""
+    entry = add_json_entry(hass)
+    current_entry.set(entry)
+    coordinator = OmnikInverterDataUpdateCoordinator(hass, entry)
+    coordinator.monitoring.profiler.start(1)
+
+    with patch("omnikinverter.OmnikInverter.request", side_effect=slow_request):
+        refresh = hass.async_create_task(coordinator.async_refresh())
+        await asyncio.sleep(0)
+        # A sample taken while the refresh waits on the network.
+        await asyncio.gather(
+            asyncio.create_task(coordinator._async_fetch_data(include_device=False)),
+            refresh,
+        )
+
+    capture = coordinator.monitoring.profiler.as_dict()
+    assert capture is not None
+    assert capture["status"] == "complete"
+    assert capture["captured"] == 1
+    assert capture["hot_functions"]
+
+    phases = capture["refreshes"][0]["phases"]
+    assert 0 < phases["decode"] < NETWORK_DELAY * 1000
+    assert phases["network_wait"] >= NETWORK_DELAY * 1000
+    assert phases["request"] == pytest.approx(
+        phases["decode"] + phases["network_wait"], abs=0.01
+    )
+    assert phases["request"] <= capture["refreshes"][0]["total_ms"]
+
+
+async def test_profile_overlapping_refreshes(hass: HomeAssistant) -> None:
+    """Test a refresh overlapping the captured one leaves its timing alone."""
+    entry = add_json_entry(hass)
+    current_entry.set(entry)
+    coordinator = OmnikInverterDataUpdateCoordinator(hass, entry)
+    coordinator.monitoring.profiler.start(2)
+    update = coordinator._async_update_data
+    updates = 0
+
+    async def _update() -> OmnikInverterData:
+        """Update the data, taking longer for the first refresh.
+
+        Returns:
+            The updated data.
+
+        """
+        nonlocal updates
+        updates += 1
+        first = updates == 1
+        data = await update()
+        if first:
+            await asyncio.sleep(NETWORK_DELAY)
+        return data
+
+    with (
+        patch("omnikinverter.OmnikInverter.request", side_effect=slow_request),
+        patch.object(coordinator, "_async_update_data", _update),
+    ):
+        first = hass.async_create_task(coordinator.async_refresh())
+        await asyncio.sleep(0)
+        # Joins the request of the first refresh and finishes before it.
+        second = hass.async_create_task(coordinator.async_refresh())
+        await asyncio.gather(first, second)
+
+    capture = coordinator.monitoring.profiler.as_dict()
+    assert capture is not None
+    assert capture["status"] == "running"
+    assert capture["captured"] == 1
+
+    refresh = capture["refreshes"][0]
+    assert refresh["phases"]["network_wait"] >= NETWORK_DELAY * 1000
+    assert refresh["total_ms"] >= refresh["phases"]["request"] + NETWORK_DELAY * 1000
+
+    # The next refresh is captured once the first one finished.
+    with patch("omnikinverter.OmnikInverter.request", side_effect=slow_request):
+        await coordinator.async_refresh()
+
+    capture = coordinator.monitoring.profiler.as_dict()
+    assert capture is not None
+    assert capture["status"] == "complete"
+    assert capture["captured"] == 2
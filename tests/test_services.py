@@ -0,0 +1,60 @@
+"""Tests for the services of the Omnik Inverter integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntryState, current_entry
+
+from custom_components.omnik_inverter.const import DOMAIN
+from custom_components.omnik_inverter.coordinator import (
+    OmnikInverterDataUpdateCoordinator,
+)
+from custom_components.omnik_inverter.services import (
+    SERVICE_REFRESH,
+    async_setup_services,
+)
+
+from . import add_json_entry, slow_request
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_refresh_entries_of_a_logger(hass: HomeAssistant) -> None:
+    """Test entries on the same logger are refreshed together."""
+    async_setup_services(hass)
+    entries = [add_json_entry(hass), add_json_entry(hass)]
+    for entry in entries:
+        current_entry.set(entry)
+        entry.runtime_data = OmnikInverterDataUpdateCoordinator(hass, entry)
+        entry.mock_state(hass, ConfigEntryState.LOADED)
+
+    with patch(
+        "omnikinverter.OmnikInverter.request", side_effect=slow_request
+    ) as request:
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_REFRESH, blocking=True, return_response=True
+        )
+        assert response is not None
+        results = response["entries"]
+        assert [results[entry.entry_id]["result"] for entry in entries] == [
+            "refreshed",
+            "refreshed",
+        ]
+        # The entries share the requests to the logger.
+        assert request.call_count == 2
+
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_REFRESH, blocking=True, return_response=True
+        )
+        assert response is not None
+        results = response["entries"]
+        assert [results[entry.entry_id]["result"] for entry in entries] == [
+            "rate_limited",
+            "rate_limited",
+        ]
+
+    for entry in entries:
+        await entry.runtime_data.async_shutdown()
@@ -0,0 +1,137 @@
+"""Tests for the raw TCP decoder of the Omnik Inverter integration."""
+
+from __future__ import annotations
+
+import random
+import struct
+
+import pytest
+
+from custom_components.omnik_inverter.tcp import (
+    MESSAGE_TYPE_INFORMATION_REPLY,
+    MESSAGE_TYPE_STRING,
+    UINT16_MAX,
+    decode_reply,
+)
+from omnikinverter import Inverter
+from omnikinverter.exceptions import OmnikInverterPacketInvalidError
+from omnikinverter.tcp import parse_messages
+
+from . import SERIAL_NUMBER
+
+LOGGER_SERIAL_NUMBER = 1608449224
+FUZZ_ROUNDS = 2000
+
+# The fields of an information reply as sent by a single phase inverter with
+# two DC strings: temperature, DC input voltage and current, AC output current
+# and voltage, AC output frequency and power pairs, energy today, energy total,
+# hours total and inverter active.
+INFORMATION = struct.pack(
+    ">3s16sH3H3H3H3H6HHIIH4xH10x",
+    b"\x81\x02\x01",
+    SERIAL_NUMBER.encode(),
+    415,
+    *(1869, 1901, UINT16_MAX),
+    *(32, 30, UINT16_MAX),
+    *(56, UINT16_MAX, UINT16_MAX),
+    *(2301, UINT16_MAX, UINT16_MAX),
+    *(5001, 1235, UINT16_MAX, UINT16_MAX, UINT16_MAX, UINT16_MAX),
+    1027,
+    13012,
+    3712,
+    1,
+    0,
+)
+FIRMWARE = struct.pack(">16s4x16s4x", b"V5.04Build230", b"V4.12Build246")
+
+
+def _frame(message_type: int, payload: bytes) -> bytes:
+    """Frame a message like the logger does.
+
+    Args:
+        message_type: The type of the message.
+        payload: The payload of the message.
+
+    Returns:
+        The framed message.
+
+    """
+    serial_number = LOGGER_SERIAL_NUMBER.to_bytes(4, "little")
+    body = bytes([len(payload), 0x41, message_type]) + 2 * serial_number + payload
+    return b"\x68" + body + bytes([sum(body) & 0xFF, 0x16])
+
+
+REPLIES = {
+    "information": _frame(MESSAGE_TYPE_INFORMATION_REPLY, INFORMATION),
+    "firmware": _frame(MESSAGE_TYPE_INFORMATION_REPLY, INFORMATION + FIRMWARE),
+    "text_and_padding": (
+        _frame(MESSAGE_TYPE_INFORMATION_REPLY, INFORMATION + FIRMWARE)
+        + _frame(MESSAGE_TYPE_STRING, b"NO INVERTER DATA")
+        + b"\xff" * 8
+    ),
+}
+
+
+def _decode(data: bytes) -> Inverter | None:
+    """Decode a reply, returning None if it is rejected as invalid.
+
+    Args:
+        data: The raw reply.
+
+    Returns:
+        The inverter data, or None if the reply is invalid.
+
+    """
+    try:
+        return decode_reply(data)
+    except OmnikInverterPacketInvalidError:
+        return None
+
+
+@pytest.mark.parametrize("reply", REPLIES.values(), ids=REPLIES.keys())
+def test_decode_reply_matches_library(reply: bytes) -> None:
+    """Test the fast decoder matches the parser of the library."""
+    expected = Inverter.from_tcp(parse_messages(LOGGER_SERIAL_NUMBER, reply))
+    assert decode_reply(reply) == expected
+    assert decode_reply(bytearray(reply)) == expected
+
+
+@pytest.mark.parametrize("reply", REPLIES.values(), ids=REPLIES.keys())
+def test_decode_reply_truncated(reply: bytes) -> None:
+    """Test truncated replies are rejected as invalid."""
+    information_size = len(REPLIES["firmware"])
+    for size in range(len(reply)):
+        if size < information_size:
+            with pytest.raises(OmnikInverterPacketInvalidError):
+                decode_reply(reply[:size])
+        else:
+            # The information reply is complete, the rest may be cut off.
+            _decode(reply[:size])
+
+
+@pytest.mark.parametrize("reply", REPLIES.values(), ids=REPLIES.keys())
+def test_decode_reply_corrupted(reply: bytes) -> None:
+    """Test corrupted replies only raise invalid packet errors."""
+    rnd = random.Random(reply)  # noqa: S311
+    for _ in range(FUZZ_ROUNDS):
+        data = bytearray(reply)
+        for _ in range(rnd.randint(1, 3)):
+            data[rnd.randrange(len(data))] = rnd.randrange(256)
+        _decode(data)
+
+
+def test_decode_reply_corrupted_payload() -> None:
+    """Test validly framed replies with corrupted payloads are handled."""
+    payload = INFORMATION + FIRMWARE
+    rnd = random.Random(payload)  # noqa: S311
+    decoded = 0
+    for _ in range(FUZZ_ROUNDS):
+        data = bytearray(payload[: rnd.randint(0, len(payload))])
+        for _ in range(rnd.randint(0, 8) if data else 0):
+            data[rnd.randrange(len(data))] = rnd.randrange(256)
+        message_type = rnd.choice(
+            [MESSAGE_TYPE_INFORMATION_REPLY] * 8 + [MESSAGE_TYPE_STRING, 0x00]
+        )
+        if _decode(_frame(message_type, bytes(data))) is not None:
+            decoded += 1
+    assert decoded